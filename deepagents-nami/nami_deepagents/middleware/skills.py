@@ -124,6 +124,18 @@ MAX_SKILL_FILE_SIZE = 10 * 1024 * 1024
 MAX_SKILL_NAME_LENGTH = 64
 MAX_SKILL_DESCRIPTION_LENGTH = 1024
 
+# A flat ``key: value`` frontmatter line, as used by almost every SKILL.md
+_FLAT_FRONTMATTER_LINE = re.compile(r"([A-Za-z_][\w-]*): +(\S.*?) *")
+
+# Plain scalars YAML would not read as the literal string: inline mappings or
+# comments, a trailing colon, tabs, leading indicator characters, the merge and
+# value keys, and null/bool/number-like values
+_YAML_SPECIAL_SCALAR = re.compile(
+    r": | #|:$|\t|^[-?:,\[\]{}#&*!|>%@`]|^[+.0-9~]|^(?:=|<<)$"
+    r"|^(?:null|true|false|yes|no|on|off)$",
+    re.IGNORECASE,
+)
+
 
 class SkillMetadata(TypedDict):
     """Metadata for a skill per Agent Skills specification (https://agentskills.io/specification)."""
@@ -201,6 +213,45 @@ def _validate_skill_name(name: str, directory_name: str) -> tuple[bool, str]:
     return True, ""
 
 
+def _parse_frontmatter(frontmatter_str: str) -> object:
+    """Parse SKILL.md frontmatter, skipping YAML for flat ``key: value`` blocks.
+
+    Falls back to ``yaml.safe_load`` as soon as a line uses anything beyond
+    flat string values (nesting, lists, block scalars, escapes, non-strings),
+    so the result always matches what YAML would produce.
+
+    Args:
+        frontmatter_str: Text between the ``---`` delimiters
+
+    Returns:
+        The parsed frontmatter
+
+    Raises:
+        yaml.YAMLError: If the frontmatter needs YAML and is invalid
+    """
+    data: dict[str, str] = {}
+    for line in frontmatter_str.splitlines():
+        if not line.strip():
+            continue
+        match = _FLAT_FRONTMATTER_LINE.fullmatch(line)
+        if match is None or _YAML_SPECIAL_SCALAR.search(match.group(1)):
+            return yaml.safe_load(frontmatter_str)
+
+        key, value = match.groups()
+        if value[0] in "\"'":
+            # Quoted strings without escapes or embedded quotes
+            if len(value) < 2 or value[-1] != value[0] or "\\" in value or value[0] in value[1:-1]:
+                return yaml.safe_load(frontmatter_str)
+            value = value[1:-1]
+        elif _YAML_SPECIAL_SCALAR.search(value):
+            return yaml.safe_load(frontmatter_str)
+        data[key] = value
+
+    if not data:
+        return yaml.safe_load(frontmatter_str)
+    return data
+
+
 def _parse_skill_metadata(
     content: str,
     skill_path: str,
@@ -228,7 +279,7 @@ def _parse_skill_metadata(
 
     # Parse YAML using safe_load for proper nested structure support
     try:
-        frontmatter_data = yaml.safe_load(frontmatter_str)
+        frontmatter_data = _parse_frontmatter(frontmatter_str)
     except yaml.YAMLError as e:
         logger.warning("Invalid YAML in %s: %s", skill_path, e)
         return None
@@ -0,0 +1,46 @@
+"""Unit tests for _parse_frontmatter() parity with yaml.safe_load."""
+
+import pytest
+import yaml
+
+from nami_deepagents.middleware.skills import _parse_frontmatter
+
+
+def _parse(parser, text):
+    """Run a parser, reducing YAML errors to a comparable marker."""
+    try:
+        return parser(text)
+    except yaml.YAMLError:
+        return "YAMLError"
+
+
+class TestParseFrontmatter:
+    """The fast path must produce exactly what yaml.safe_load produces."""
+
+    @pytest.mark.parametrize(
+        "frontmatter",
+        [
+            "name: web-research\ndescription: Structured web research",
+            "name: my-skill\ndescription: Handles a: b style notes",
+            'name: my-skill\ndescription: "Quoted: value"',
+            "name: my-skill\ndescription: 'single quoted'",
+            "name: my-skill\ndescription: Use this when:",
+            "name: my-skill\ndescription: =",
+            "name: my-skill\ndescription: <<",
+            "name: my-skill\ndescription:\tTab separated",
+            "name: my-skill\ndescription: value\t# tab comment",
+            "name: my-skill\ndescription: value # comment",
+            "name: my-skill\ndescription: a\tb",
+            "name: my-skill\ndescription: a:\tb",
+            "name: my-skill\ndescription: trailing tab\t",
+            "name: my-skill\ndescription: true",
+            "name: my-skill\ndescription: 1.0",
+            "name: my-skill\ndescription: ~",
+            "name: my-skill\nmetadata:\n  owner: docs",
+            "name: my-skill\nallowed-tools: [read_file, write_file]",
+            "name: my-skill\ndescription: |\n  Block scalar",
+        ],
+    )
+    def test_matches_yaml(self, frontmatter):
+        """Test that each frontmatter parses (or fails) as YAML does."""
+        assert _parse(_parse_frontmatter, frontmatter) == _parse(yaml.safe_load, frontmatter)
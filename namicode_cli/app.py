@@ -10,7 +10,7 @@ import asyncio
 import contextlib
 import subprocess
 import time
-import uuid
+from os import urandom
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
 
@@ -286,7 +286,7 @@ class NamiCodeApp(App):
                 await asyncio.sleep(0.1)
 
         # Create menu with unique ID to avoid conflicts
-        unique_id = f"approval-menu-{uuid.uuid4().hex[:8]}"
+        unique_id = f"approval-menu-{urandom(4).hex()}"
         menu = ApprovalMenu(action_request, assistant_id, id=unique_id)
         menu.set_future(result_future)
 
@@ -444,7 +444,7 @@ class NamiCodeApp(App):
             await self._clear_messages()
             # Reset thread to start fresh conversation
             if self._session_state:
-                self._session_state.thread_id = uuid.uuid4().hex[:8]
+                self._session_state.thread_id = urandom(4).hex()
             if self._token_tracker:
                 self._token_tracker.reset()
             await self._mount_message(
@@ -57,7 +57,7 @@ from namicode_cli.skills.skill_creation import (
     _ask_scope,
     _info,
     _list,
-    _create,
+    _create_many,
     _validate_name,
     _generate_skill,
     _get_static_template,
@@ -3298,13 +3298,18 @@ def execute_skills_command(args: argparse.Namespace) -> None:
             agent=args.agent,
             project=args.project,
             global_scope=getattr(args, "global_scope", False),
+            ask=not getattr(args, "yes", False),
         )
     elif args.skills_command == "create":
-        _create(
-            args.name,
-            agent=args.agent,
-            project=args.project,
-            global_scope=getattr(args, "global_scope", False),
+        asyncio.run(
+            _create_many(
+                args.name,
+                agent=args.agent,
+                project=args.project,
+                global_scope=getattr(args, "global_scope", False),
+                ask=not getattr(args, "yes", False),
+                description=getattr(args, "description", None),
+            )
         )
     elif args.skills_command == "info":
         _info(
@@ -3312,6 +3317,7 @@ def execute_skills_command(args: argparse.Namespace) -> None:
             agent=args.agent,
             project=args.project,
             global_scope=getattr(args, "global_scope", False),
+            ask=not getattr(args, "yes", False),
         )
     else:
         # No subcommand provided, show help
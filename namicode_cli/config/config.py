@@ -27,7 +27,6 @@ Environment Configuration:
 import os
 import re
 import sys
-import uuid
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -368,6 +367,9 @@ class Settings:
     langsmith_workspace_id: str | None = None
     langsmith_tracing_enabled: bool = False
 
+    # Re-encode clipboard images as lossy JPEG instead of PNG (NAMI_CLIPBOARD_JPEG=true)
+    clipboard_jpeg: bool = False
+
     version: str = "1.0.0"
 
     @classmethod
@@ -432,6 +434,9 @@ class Settings:
         langsmith_project = os.environ.get("LANGSMITH_PROJECT", "Nami-Code")
         langsmith_workspace = os.environ.get("LANGSMITH_WORKSPACE_ID")
 
+        # Clipboard image encoding
+        clipboard_jpeg = os.environ.get("NAMI_CLIPBOARD_JPEG", "").lower() == "true"
+
         return cls(
             openai_api_key=openai_key,
             anthropic_api_key=anthropic_key,
@@ -444,6 +449,7 @@ class Settings:
             langsmith_project=langsmith_project,
             langsmith_workspace_id=langsmith_workspace,
             langsmith_tracing_enabled=langsmith_enabled,
+            clipboard_jpeg=clipboard_jpeg,
         )
 
     @property
@@ -1,8 +1,8 @@
 import os
 import re
 import sys
-import uuid
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 import dotenv
@@ -149,44 +149,46 @@ def create_model() -> BaseChatModel:
 # =============================================================================
 
 # Models known to support vision/multimodal capabilities
-VISION_CAPABLE_MODELS: dict[str, bool] = {
-    # Anthropic - Claude 3+ models support vision
-    "claude-sonnet-4-5-20250929": True,
-    "claude-opus-4-5-20251001": True,
-    "claude-3-5-sonnet-20241022": True,
-    "claude-3-5-sonnet-20240620": True,
-    "claude-3-5-haiku-20241022": True,
-    "claude-3-opus-20240229": True,
-    "claude-3-sonnet-20240229": True,
-    "claude-3-haiku-20240307": True,
-    # OpenAI - GPT-4 Vision models
-    "gpt-4o": True,
-    "gpt-4o-mini": True,
-    "gpt-4-turbo": True,
-    "gpt-4-vision-preview": True,
-    "gpt-4-turbo-2024-04-09": True,
-    # Google - Gemini 1.5+ models
-    "gemini-1.5-pro": True,
-    "gemini-1.5-flash": True,
-    "gemini-2.0-flash-exp": True,
-    "gemini-3-pro-preview": True,
-    # Ollama vision models (common ones)
-    "llava": True,
-    "llava:7b": True,
-    "llava:13b": True,
-    "llava:34b": True,
-    "bakllava": True,
-    "moondream": True,
-    "moondream2": True,
-    "llava-llama3": True,
-    "llava-phi3": True,
-    "minicpm-v": True,
-    # User's preferred model
-    "qwen3-vl:235b-cloud": True,
-    "qwen2-vl": True,
-    "qwen2-vl:7b": True,
-    "qwen2-vl:72b": True,
-}
+VISION_CAPABLE_MODELS: frozenset[str] = frozenset(
+    {
+        # Anthropic - Claude 3+ models support vision
+        "claude-sonnet-4-5-20250929",
+        "claude-opus-4-5-20251001",
+        "claude-3-5-sonnet-20241022",
+        "claude-3-5-sonnet-20240620",
+        "claude-3-5-haiku-20241022",
+        "claude-3-opus-20240229",
+        "claude-3-sonnet-20240229",
+        "claude-3-haiku-20240307",
+        # OpenAI - GPT-4 Vision models
+        "gpt-4o",
+        "gpt-4o-mini",
+        "gpt-4-turbo",
+        "gpt-4-vision-preview",
+        "gpt-4-turbo-2024-04-09",
+        # Google - Gemini 1.5+ models
+        "gemini-1.5-pro",
+        "gemini-1.5-flash",
+        "gemini-2.0-flash-exp",
+        "gemini-3-pro-preview",
+        # Ollama vision models (common ones)
+        "llava",
+        "llava:7b",
+        "llava:13b",
+        "llava:34b",
+        "bakllava",
+        "moondream",
+        "moondream2",
+        "llava-llama3",
+        "llava-phi3",
+        "minicpm-v",
+        # User's preferred model
+        "qwen3-vl:235b-cloud",
+        "qwen2-vl",
+        "qwen2-vl:7b",
+        "qwen2-vl:72b",
+    }
+)
 
 # Keywords that indicate vision capability in model names
 VISION_KEYWORDS = [
@@ -204,6 +206,9 @@ VISION_KEYWORDS = [
     "qwen3-vl",
 ]
 
+# Single alternation over all keywords so unknown model names are scanned once
+_VISION_KEYWORDS_RE = re.compile("|".join(re.escape(k) for k in VISION_KEYWORDS))
+
 
 def model_supports_vision(model_name: str) -> bool:
     """Check if a model supports vision/multimodal capabilities.
@@ -217,16 +222,11 @@ def model_supports_vision(model_name: str) -> bool:
     # Normalize model name for comparison
     model_lower = model_name.lower()
 
-    # Check registry first (exact match)
-    if model_name in VISION_CAPABLE_MODELS:
-        return VISION_CAPABLE_MODELS[model_name]
-
-    # Check registry with lowercase
-    if model_lower in VISION_CAPABLE_MODELS:
-        return VISION_CAPABLE_MODELS[model_lower]
-
-    # For unknown models, check if name contains vision keywords
-    return any(keyword in model_lower for keyword in VISION_KEYWORDS)
+    # Check registry (all entries are lowercase), then vision keywords
+    return (
+        model_lower in VISION_CAPABLE_MODELS
+        or _VISION_KEYWORDS_RE.search(model_lower) is not None
+    )
 
 
 def get_vision_model_suggestion(current_model: str) -> str | None:
@@ -253,9 +253,13 @@ def get_vision_model_suggestion(current_model: str) -> str | None:
         return "qwen3-vl:235b-cloud"
 
 
+@lru_cache(maxsize=1)
 def get_current_model_name() -> str:
     """Get the name of the currently configured model.
 
+    The result is cached; call ``get_current_model_name.cache_clear()`` after
+    the saved model configuration changes.
+
     Returns:
         Model name string
     """
@@ -10,6 +10,13 @@ from typing import Any
 from namicode_cli.config.config import Settings
 
 
+def _invalidate_model_name_cache() -> None:
+    """Drop the cached result of get_current_model_name."""
+    from namicode_cli.config.model_create import get_current_model_name
+
+    get_current_model_name.cache_clear()
+
+
 class NamiConfig:
     """Manages persistent configuration for Nami CLI."""
 
@@ -63,12 +70,14 @@ class NamiConfig:
             "model": model,
         }
         self._save()
+        _invalidate_model_name_cache()
 
     def clear_model_config(self) -> None:
         """Clear saved model configuration."""
         if "model" in self._config:
             del self._config["model"]
             self._save()
+            _invalidate_model_name_cache()
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value.
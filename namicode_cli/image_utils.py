@@ -1,20 +1,42 @@
 """Utilities for handling image paste from clipboard and file loading."""
 
+from __future__ import annotations
+
 import base64
 import io
 import os
-import subprocess
+import shutil
+import struct
 import sys
-import tempfile
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PIL import Image
 
-from PIL import Image
+# PIL, subprocess and tempfile are imported inside the helpers that use them
+# so that sessions which never touch images don't pay for them at startup.
 
 # Constants for image validation
 MAX_IMAGE_SIZE_BYTES = 20 * 1024 * 1024  # 20MB
 MAX_IMAGE_DIMENSION = 7680  # Max width/height
-SUPPORTED_FORMATS = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp", ".tiff", ".tif"}
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"  # First 8 bytes of every PNG file
+SUPPORTED_FORMATS = frozenset(
+    {".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp", ".tiff", ".tif"}
+)
+# PIL decoder for each supported extension, so Image.open skips format probing
+PIL_FORMATS = {
+    ".png": "PNG",
+    ".jpg": "JPEG",
+    ".jpeg": "JPEG",
+    ".gif": "GIF",
+    ".webp": "WEBP",
+    ".bmp": "BMP",
+    ".tiff": "TIFF",
+    ".tif": "TIFF",
+}
 
 
 @dataclass
@@ -33,15 +55,52 @@ class ImageData:
         """
         return {
             "type": "image_url",
-            "image_url": {"url": f"data:image/{self.format};base64,{self.base64_data}"},
+            "image_url": {"url": self.data_url},
         }
 
+    @cached_property
+    def data_url(self) -> str:
+        """Get the data URL, built once per image and reused across messages."""
+        return f"data:image/{self.format};base64,{self.base64_data}"
+
     @property
     def size_kb(self) -> float:
         """Get approximate size in KB."""
         return len(self.base64_data) * 3 / 4 / 1024  # Base64 is ~4/3 of original
 
 
+def _flatten_alpha(image: Image.Image) -> Image.Image:
+    """Composite an RGBA, LA or palette image onto a white background.
+
+    Blends with NumPy in a single pass over the pixel buffer when it is
+    available, otherwise falls back to PIL's masked paste.
+
+    Args:
+        image: PIL Image in RGBA, LA or P mode
+
+    Returns:
+        RGB image with transparency flattened to white
+    """
+    from PIL import Image
+
+    if image.mode != "RGBA":
+        image = image.convert("RGBA")
+
+    try:
+        import numpy as np
+    except ImportError:
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        return background
+
+    pixels = np.asarray(image)
+    rgb = pixels[..., :3]
+    alpha = pixels[..., 3:4].astype(np.uint32)
+    # out = rgb * a + 255 * (1 - a), in integer math with rounding
+    blended = (rgb * alpha + 255 * (255 - alpha) + 127) // 255
+    return Image.fromarray(blended.astype(np.uint8))
+
+
 def get_clipboard_image() -> ImageData | None:
     """Attempt to read an image from the system clipboard.
 
@@ -50,13 +109,42 @@ def get_clipboard_image() -> ImageData | None:
     Returns:
         ImageData if an image is found, None otherwise
     """
-    if sys.platform == "darwin":
-        return _get_macos_clipboard_image()
-    elif sys.platform == "win32":
-        return _get_windows_clipboard_image()
-    elif sys.platform.startswith("linux"):
-        return _get_linux_clipboard_image()
-    return None
+    return _CLIPBOARD_BACKEND() if _CLIPBOARD_BACKEND is not None else None
+
+
+def _clipboard_jpeg_enabled() -> bool:
+    """Check whether clipboard captures should be re-encoded as JPEG."""
+    from namicode_cli.config.config import settings
+
+    return settings.clipboard_jpeg
+
+
+def _clipboard_image_from_png(png_bytes: bytes) -> ImageData | None:
+    """Build ImageData from PNG bytes read off the clipboard.
+
+    Screenshots are re-encoded as JPEG unless the user opted into PNG,
+    which typically shrinks the payload 5-10x.
+
+    Args:
+        png_bytes: Raw PNG bytes
+
+    Returns:
+        ImageData, or None if the bytes could not be decoded
+    """
+    if _clipboard_jpeg_enabled():
+        from PIL import Image
+
+        try:
+            image = Image.open(io.BytesIO(png_bytes), formats=["PNG"])
+            return ImageProcessor.process_pil_image(image, "[image]")
+        except Exception:
+            return None
+
+    return ImageData(
+        base64_data=base64.b64encode(png_bytes).decode("ascii"),
+        format="png",
+        placeholder="[image]",
+    )
 
 
 def _get_windows_clipboard_image() -> ImageData | None:
@@ -66,7 +154,7 @@ def _get_windows_clipboard_image() -> ImageData | None:
         ImageData if an image is found, None otherwise
     """
     try:
-        from PIL import ImageGrab
+        from PIL import Image, ImageGrab
 
         img = ImageGrab.grabclipboard()
         if img is None:
@@ -84,22 +172,20 @@ def _get_windows_clipboard_image() -> ImageData | None:
             return None
 
         if isinstance(img, Image.Image):
+            # JPEG captures are optimized straight from PIL
+            if _clipboard_jpeg_enabled():
+                return ImageProcessor.process_pil_image(img, "[image]")
+
             # Convert to PNG and encode
             buffer = io.BytesIO()
             # Convert to RGB if necessary (handle RGBA, palette modes)
             if img.mode in ("RGBA", "LA", "P"):
-                # Create white background for transparency
-                background = Image.new("RGB", img.size, (255, 255, 255))
-                if img.mode == "P":
-                    img = img.convert("RGBA")
-                if img.mode in ("RGBA", "LA"):
-                    background.paste(img, mask=img.split()[-1])
-                    img = background
+                img = _flatten_alpha(img)
             elif img.mode != "RGB":
                 img = img.convert("RGB")
 
             img.save(buffer, format="PNG")
-            base64_data = base64.b64encode(buffer.getvalue()).decode("utf-8")
+            base64_data = base64.b64encode(buffer.getbuffer()).decode("ascii")
             return ImageData(
                 base64_data=base64_data,
                 format="png",
@@ -113,68 +199,76 @@ def _get_windows_clipboard_image() -> ImageData | None:
     return None
 
 
+def _linux_clipboard_commands() -> list[list[str]]:
+    """Build the clipboard read commands for the tools installed on this system.
+
+    Binaries are looked up once at import time so a paste never forks a tool
+    that isn't there. wl-paste is preferred on Wayland sessions, xclip otherwise.
+
+    Returns:
+        Commands to try in order
+    """
+    wl_paste = shutil.which("wl-paste")
+    xclip = shutil.which("xclip")
+    commands = []
+    if wl_paste:
+        commands.append([wl_paste, "--type", "image/png"])
+    if xclip:
+        xclip_command = [xclip, "-selection", "clipboard", "-t", "image/png", "-o"]
+        if os.environ.get("WAYLAND_DISPLAY"):
+            commands.append(xclip_command)
+        else:
+            commands.insert(0, xclip_command)
+    return commands
+
+
+_LINUX_CLIPBOARD_COMMANDS = (
+    _linux_clipboard_commands() if sys.platform.startswith("linux") else []
+)
+
+
 def _get_linux_clipboard_image() -> ImageData | None:
     """Get clipboard image on Linux using wl-paste (Wayland) or xclip (X11).
 
     Returns:
         ImageData if an image is found, None otherwise
     """
-    # Try Wayland first (wl-paste)
-    try:
-        result = subprocess.run(
-            ["wl-paste", "--type", "image/png"],
-            capture_output=True,
-            check=False,
-            timeout=2,
-        )
-        if result.returncode == 0 and result.stdout:
-            try:
-                # Validate it's a real image
-                Image.open(io.BytesIO(result.stdout))
-                base64_data = base64.b64encode(result.stdout).decode("utf-8")
-                return ImageData(
-                    base64_data=base64_data,
-                    format="png",
-                    placeholder="[image]",
-                )
-            except Exception:
-                pass
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        pass
+    import subprocess
 
-    # Try X11 (xclip)
-    try:
-        result = subprocess.run(
-            ["xclip", "-selection", "clipboard", "-t", "image/png", "-o"],
-            capture_output=True,
-            check=False,
-            timeout=2,
-        )
-        if result.returncode == 0 and result.stdout:
-            try:
-                Image.open(io.BytesIO(result.stdout))
-                base64_data = base64.b64encode(result.stdout).decode("utf-8")
-                return ImageData(
-                    base64_data=base64_data,
-                    format="png",
-                    placeholder="[image]",
-                )
-            except Exception:
-                pass
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        pass
+    for command in _LINUX_CLIPBOARD_COMMANDS:
+        try:
+            result = subprocess.run(
+                command,
+                capture_output=True,
+                check=False,
+                timeout=2,
+            )
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            continue
+
+        # Validate it's a real PNG (we asked for image/png)
+        if result.returncode == 0 and result.stdout.startswith(PNG_SIGNATURE):
+            return _clipboard_image_from_png(result.stdout)
 
     return None
 
 
 def _get_macos_clipboard_image() -> ImageData | None:
-    """Get clipboard image on macOS using pngpaste or osascript.
+    """Get clipboard image on macOS using PyObjC, pngpaste or osascript.
 
-    First tries pngpaste (faster if installed), then falls back to osascript.
+    Reads the pasteboard in-process when PyObjC is installed. Otherwise tries
+    pngpaste (faster if installed), then falls back to osascript.
 
     Returns:
         ImageData if an image is found, None otherwise
     """
+    import subprocess
+
+    try:
+        return _get_clipboard_via_pyobjc()
+    except ImportError:
+        pass  # PyObjC not installed
+
     # Try pngpaste first (fast if installed)
     try:
         result = subprocess.run(
@@ -183,18 +277,9 @@ def _get_macos_clipboard_image() -> ImageData | None:
             check=False,
             timeout=2,
         )
-        if result.returncode == 0 and result.stdout:
-            # Successfully got PNG data
-            try:
-                Image.open(io.BytesIO(result.stdout))  # Validate it's a real image
-                base64_data = base64.b64encode(result.stdout).decode("utf-8")
-                return ImageData(
-                    base64_data=base64_data,
-                    format="png",  # 'pngpaste -' always outputs PNG
-                    placeholder="[image]",
-                )
-            except Exception:
-                pass  # Invalid image data
+        # Successfully got PNG data ('pngpaste -' always outputs PNG)
+        if result.returncode == 0 and result.stdout.startswith(PNG_SIGNATURE):
+            return _clipboard_image_from_png(result.stdout)
     except (FileNotFoundError, subprocess.TimeoutExpired):
         pass  # pngpaste not installed or timed out
 
@@ -202,6 +287,70 @@ def _get_macos_clipboard_image() -> ImageData | None:
     return _get_clipboard_via_osascript()
 
 
+def _get_clipboard_via_pyobjc() -> ImageData | None:
+    """Get clipboard image on macOS by reading NSPasteboard in-process.
+
+    Avoids the subprocess and temp-file round trips of the other macOS paths.
+
+    Returns:
+        ImageData if an image is found, None otherwise
+
+    Raises:
+        ImportError: If PyObjC (AppKit) is not installed
+    """
+    from AppKit import NSPasteboard, NSPasteboardTypePNG, NSPasteboardTypeTIFF
+    from PIL import Image
+
+    pasteboard = NSPasteboard.generalPasteboard()
+    data = pasteboard.dataForType_(NSPasteboardTypePNG)
+    if data is None:
+        data = pasteboard.dataForType_(NSPasteboardTypeTIFF)
+    if data is None:
+        return None
+
+    try:
+        image = Image.open(io.BytesIO(bytes(data)), formats=["PNG", "TIFF"])
+        if _clipboard_jpeg_enabled():
+            return ImageProcessor.process_pil_image(image, "[image]")
+        if image.format == "PNG":
+            base64_data = base64.b64encode(bytes(data)).decode("ascii")
+        else:
+            # Convert to PNG (e.g., if we got TIFF)
+            buffer = io.BytesIO()
+            image.save(buffer, format="PNG")
+            base64_data = base64.b64encode(buffer.getbuffer()).decode("ascii")
+    except Exception:
+        return None
+
+    return ImageData(
+        base64_data=base64_data,
+        format="png",
+        placeholder="[image]",
+    )
+
+
+# Constant AppleScript sources; the output path is passed in as argv
+_OSASCRIPT_PNG_SCRIPT = """
+on run argv
+    set pngData to the clipboard as «class PNGf»
+    set theFile to open for access POSIX file (item 1 of argv) with write permission
+    write pngData to theFile
+    close access theFile
+    return "success"
+end run
+"""
+
+_OSASCRIPT_TIFF_SCRIPT = """
+on run argv
+    set tiffData to the clipboard as TIFF picture
+    set theFile to open for access POSIX file (item 1 of argv) with write permission
+    write tiffData to theFile
+    close access theFile
+    return "success"
+end run
+"""
+
+
 def _get_clipboard_via_osascript() -> ImageData | None:
     """Get clipboard image via osascript using a temp file.
 
@@ -211,6 +360,11 @@ def _get_clipboard_via_osascript() -> ImageData | None:
     Returns:
         ImageData if an image is found, None otherwise
     """
+    import subprocess
+    import tempfile
+
+    from PIL import Image
+
     # Create a temp file for the image
     fd, temp_path = tempfile.mkstemp(suffix=".png")
     os.close(fd)
@@ -234,25 +388,12 @@ def _get_clipboard_via_osascript() -> ImageData | None:
             return None
 
         # Try to get PNG first, fall back to TIFF
-        if "pngf" in clipboard_info:
-            get_script = f"""
-            set pngData to the clipboard as «class PNGf»
-            set theFile to open for access POSIX file "{temp_path}" with write permission
-            write pngData to theFile
-            close access theFile
-            return "success"
-            """
-        else:
-            get_script = f"""
-            set tiffData to the clipboard as TIFF picture
-            set theFile to open for access POSIX file "{temp_path}" with write permission
-            write tiffData to theFile
-            close access theFile
-            return "success"
-            """
+        get_script = (
+            _OSASCRIPT_PNG_SCRIPT if "pngf" in clipboard_info else _OSASCRIPT_TIFF_SCRIPT
+        )
 
         result = subprocess.run(
-            ["osascript", "-e", get_script],
+            ["osascript", "-e", get_script, temp_path],
             capture_output=True,
             check=False,
             timeout=3,
@@ -271,12 +412,15 @@ def _get_clipboard_via_osascript() -> ImageData | None:
             image_data = f.read()
 
         try:
-            image = Image.open(io.BytesIO(image_data))
+            image = Image.open(io.BytesIO(image_data), formats=["PNG", "TIFF"])
+            if _clipboard_jpeg_enabled():
+                return ImageProcessor.process_pil_image(image, "[image]")
+
             # Convert to PNG if it's not already (e.g., if we got TIFF)
             buffer = io.BytesIO()
             image.save(buffer, format="PNG")
             buffer.seek(0)
-            base64_data = base64.b64encode(buffer.getvalue()).decode("utf-8")
+            base64_data = base64.b64encode(buffer.getbuffer()).decode("ascii")
 
             return ImageData(
                 base64_data=base64_data,
@@ -296,6 +440,15 @@ def _get_clipboard_via_osascript() -> ImageData | None:
             pass
 
 
+# Clipboard backend for the current platform, resolved once at import time
+_CLIPBOARD_BACKEND = {
+    "darwin": _get_macos_clipboard_image,
+    "win32": _get_windows_clipboard_image,
+}.get(sys.platform) or (
+    _get_linux_clipboard_image if sys.platform.startswith("linux") else None
+)
+
+
 def encode_image_to_base64(image_bytes: bytes) -> str:
     """Encode image bytes to base64 string.
 
@@ -305,7 +458,7 @@ def encode_image_to_base64(image_bytes: bytes) -> str:
     Returns:
         Base64-encoded string
     """
-    return base64.b64encode(image_bytes).decode("utf-8")
+    return base64.b64encode(image_bytes).decode("ascii")
 
 
 def create_multimodal_content(text: str, images: list[ImageData]) -> list[dict]:
@@ -344,8 +497,13 @@ def load_image_from_path(image_path: Path) -> ImageData:
         FileNotFoundError: If file doesn't exist
         ValueError: If file is too large, invalid format, or invalid image
     """
-    if not image_path.exists():
-        raise FileNotFoundError(f"Image file not found: {image_path}")
+    from PIL import Image, UnidentifiedImageError
+
+    # One stat serves both the existence and the size check
+    try:
+        file_size = image_path.stat().st_size
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Image file not found: {image_path}") from None
 
     # Check file extension
     suffix = image_path.suffix.lower()
@@ -356,7 +514,6 @@ def load_image_from_path(image_path: Path) -> ImageData:
         )
 
     # Check file size
-    file_size = image_path.stat().st_size
     if file_size > MAX_IMAGE_SIZE_BYTES:
         raise ValueError(
             f"Image too large ({file_size / 1024 / 1024:.1f}MB). "
@@ -365,7 +522,12 @@ def load_image_from_path(image_path: Path) -> ImageData:
 
     # Load and validate image
     try:
-        image = Image.open(image_path)
+        raw_bytes = image_path.read_bytes()
+        try:
+            image = Image.open(io.BytesIO(raw_bytes), formats=[PIL_FORMATS[suffix]])
+        except UnidentifiedImageError:
+            # Extension doesn't match the content - let PIL detect the format
+            image = Image.open(io.BytesIO(raw_bytes))
     except Exception as e:
         raise ValueError(f"Invalid image file: {e}") from e
 
@@ -377,20 +539,23 @@ def load_image_from_path(image_path: Path) -> ImageData:
             f"Maximum dimension is {MAX_IMAGE_DIMENSION}px"
         )
 
+    # Opaque PNGs are already in the target format - send the file as-is
+    if image.format == "PNG" and image.mode in ("RGB", "L"):
+        return ImageData(
+            base64_data=base64.b64encode(raw_bytes).decode("ascii"),
+            format="png",
+            placeholder=f"[image {image_path.name}]",
+        )
+
     # Convert to RGB if necessary and save as PNG
     if image.mode in ("RGBA", "LA", "P"):
-        background = Image.new("RGB", image.size, (255, 255, 255))
-        if image.mode == "P":
-            image = image.convert("RGBA")
-        if image.mode in ("RGBA", "LA"):
-            background.paste(image, mask=image.split()[-1])
-            image = background
+        image = _flatten_alpha(image)
     elif image.mode != "RGB":
         image = image.convert("RGB")
 
     buffer = io.BytesIO()
     image.save(buffer, format="PNG")
-    base64_data = base64.b64encode(buffer.getvalue()).decode("utf-8")
+    base64_data = base64.b64encode(buffer.getbuffer()).decode("ascii")
 
     return ImageData(
         base64_data=base64_data,
@@ -408,7 +573,9 @@ def is_image_file(path: Path) -> bool:
     Returns:
         True if path is a supported image file
     """
-    return path.is_file() and path.suffix.lower() in SUPPORTED_FORMATS
+    # Cheap suffix check first so non-images never hit the filesystem
+    ext = os.path.splitext(path)[1]
+    return ext.lower() in SUPPORTED_FORMATS and path.is_file()
 
 
 class ImageProcessor:
@@ -432,9 +599,13 @@ class ImageProcessor:
         Returns:
             Optimized image bytes
         """
+        from PIL import Image
+
         # Resize if too large
         width, height = image.size
         if width > ImageProcessor.MAX_DIMENSION or height > ImageProcessor.MAX_DIMENSION:
+            # thumbnail() already lets libjpeg draft-decode JPEGs at a reduced
+            # scale, keeping its default reducing_gap margin before LANCZOS
             image.thumbnail(
                 (ImageProcessor.MAX_DIMENSION, ImageProcessor.MAX_DIMENSION),
                 Image.Resampling.LANCZOS,
@@ -442,12 +613,7 @@ class ImageProcessor:
 
         # Convert to RGB if saving as JPEG
         if output_format == "jpeg" and image.mode in ("RGBA", "LA", "P"):
-            background = Image.new("RGB", image.size, (255, 255, 255))
-            if image.mode == "P":
-                image = image.convert("RGBA")
-            if image.mode in ("RGBA", "LA"):
-                background.paste(image, mask=image.split()[-1])
-                image = background
+            image = _flatten_alpha(image)
         elif image.mode not in ("RGB", "L"):
             image = image.convert("RGB")
 
@@ -481,26 +647,61 @@ class ImageProcessor:
         if not optimize:
             return image_data
 
+        # Small PNGs: read the dimensions from the IHDR chunk (bytes 16-24)
+        # without decoding the whole payload
+        approx_bytes = len(image_data.base64_data) * 3 // 4
+        if approx_bytes <= ImageProcessor.MAX_FILE_SIZE_BYTES and image_data.format == "png":
+            header = base64.b64decode(image_data.base64_data[:32])
+            if header.startswith(PNG_SIGNATURE) and len(header) >= 24:
+                size = struct.unpack(">II", header[16:24])
+                if not ImageProcessor.needs_optimization(size):
+                    return image_data
+
+        from PIL import Image
+
         # Decode base64
         image_bytes = base64.b64decode(image_data.base64_data)
         image = Image.open(io.BytesIO(image_bytes))
 
         # Check if optimization is needed
-        width, height = image.size
-        current_size = len(image_bytes)
+        if not ImageProcessor.needs_optimization(image.size, len(image_bytes)):
+            return image_data
 
+        return ImageProcessor.process_pil_image(image, image_data.placeholder)
+
+    @staticmethod
+    def needs_optimization(size: tuple[int, int], byte_size: int = 0) -> bool:
+        """Check whether an image exceeds the optimization thresholds.
+
+        Args:
+            size: Image (width, height)
+            byte_size: Encoded size in bytes, if known
+
+        Returns:
+            True if the image should be resized or recompressed
+        """
+        width, height = size
         needs_resize = width > ImageProcessor.MAX_DIMENSION or height > ImageProcessor.MAX_DIMENSION
-        needs_compress = current_size > ImageProcessor.MAX_FILE_SIZE_BYTES
+        needs_compress = byte_size > ImageProcessor.MAX_FILE_SIZE_BYTES
+        return needs_resize or needs_compress
 
-        if not needs_resize and not needs_compress:
-            return image_data
+    @staticmethod
+    def process_pil_image(image: Image.Image, placeholder: str) -> ImageData:
+        """Optimize an already-decoded PIL image into JPEG ImageData.
 
-        # Optimize
-        optimized_bytes = ImageProcessor.optimize_image(image, output_format="jpeg")
-        optimized_base64 = base64.b64encode(optimized_bytes).decode("utf-8")
+        Callers that hold a PIL image use this directly instead of
+        round-tripping through base64 for process_image_data.
+
+        Args:
+            image: PIL Image object
+            placeholder: Display text for the resulting ImageData
 
+        Returns:
+            Optimized ImageData in JPEG format
+        """
+        optimized_bytes = ImageProcessor.optimize_image(image, output_format="jpeg")
         return ImageData(
-            base64_data=optimized_base64,
+            base64_data=base64.b64encode(optimized_bytes).decode("ascii"),
             format="jpeg",
-            placeholder=image_data.placeholder,
+            placeholder=placeholder,
         )
\ No newline at end of file
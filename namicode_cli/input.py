@@ -347,14 +347,14 @@ def get_bottom_toolbar(
         parts.append((base_class, base_msg))
 
         # Show exit confirmation hint if active
-        hint_until = session_state.exit_hint_until
-        if hint_until is not None:
+        exit_hint = session_state.exit_hint
+        if exit_hint is not None:
             now = time.monotonic()
-            if now < hint_until:
+            if now < exit_hint[0]:
                 parts.append(("", " | "))
                 parts.append(("class:toolbar-exit", " Ctrl+C again to exit "))
             else:
-                session_state.exit_hint_until = None
+                session_state.exit_hint = None
 
         return parts
 
@@ -378,38 +378,30 @@ def create_prompt_session(
         app = event.app
         now = time.monotonic()
 
-        if (
-            session_state.exit_hint_until is not None
-            and now < session_state.exit_hint_until
-        ):
-            handle = session_state.exit_hint_handle
-            if handle:
-                handle.cancel()
-                session_state.exit_hint_handle = None
-            session_state.exit_hint_until = None
+        exit_hint = session_state.exit_hint
+        if exit_hint is not None and now < exit_hint[0]:
+            exit_hint[1].cancel()
+            session_state.exit_hint = None
             app.invalidate()
             app.exit(exception=KeyboardInterrupt())
             return
 
-        session_state.exit_hint_until = now + EXIT_CONFIRM_WINDOW
-
-        handle = session_state.exit_hint_handle
-        if handle:
-            handle.cancel()
+        if exit_hint is not None:
+            exit_hint[1].cancel()
 
         loop = asyncio.get_running_loop()
         app_ref = app
 
         def clear_hint() -> None:
-            if (
-                session_state.exit_hint_until is not None
-                and time.monotonic() >= session_state.exit_hint_until
-            ):
-                session_state.exit_hint_until = None
-                session_state.exit_hint_handle = None
+            current = session_state.exit_hint
+            if current is not None and time.monotonic() >= current[0]:
+                session_state.exit_hint = None
                 app_ref.invalidate()
 
-        session_state.exit_hint_handle = loop.call_later(EXIT_CONFIRM_WINDOW, clear_hint)  # type: ignore
+        session_state.exit_hint = (
+            now + EXIT_CONFIRM_WINDOW,
+            loop.call_later(EXIT_CONFIRM_WINDOW, clear_hint),
+        )
 
         app.invalidate()
 
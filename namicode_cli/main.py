@@ -75,6 +75,7 @@ from namicode_cli.integrations.sandbox_factory import (
 from namicode_cli.path_approval import check_path_approval, PathApprovalManager
 from namicode_cli.commands.commands import execute_skills_command
 from namicode_cli.skills.skill_creation import setup_skills_parser
+from namicode_cli.mcp import close_shared_mcp_middleware
 from namicode_cli.mcp.commands import execute_mcp_command, setup_mcp_parser
 from namicode_cli.tools import (
     check_types,
@@ -637,10 +638,9 @@ async def simple_cli(
     while True:
         try:
             user_input = await session.prompt_async()
-            if session_state.exit_hint_handle:
-                session_state.exit_hint_handle.cancel()
-                session_state.exit_hint_handle = None
-            session_state.exit_hint_until = None
+            if session_state.exit_hint is not None:
+                session_state.exit_hint[1].cancel()
+                session_state.exit_hint = None
             user_input = user_input.strip()
         except EOFError:
             await _cleanup_and_save_session()
@@ -1615,6 +1615,9 @@ def cli_main() -> None:
         # Clean exit on Ctrl+C - suppress ugly traceback
         console.print("\n\n[yellow]Interrupted[/yellow]")
         sys.exit(0)
+    finally:
+        # Shut down MCP server sessions opened by the agent
+        close_shared_mcp_middleware()
 
 
 if __name__ == "__main__":
@@ -4,14 +4,19 @@ Uses langchain-mcp-adapters for robust MCP client management with
 support for multiple transport mechanisms (stdio, SSE, HTTP).
 """
 
+import functools
+
 from namicode_cli.mcp.config import MCPConfig, MCPServerConfig
 from namicode_cli.mcp.middleware import MCPMiddleware
 
-# Shared MCPMiddleware singleton - avoids reconnecting for each subagent
-_shared_mcp_middleware: "MCPMiddleware | None" = None
+
+@functools.cache
+def _shared_mcp_middleware() -> MCPMiddleware:
+    """Build the shared MCPMiddleware on first use."""
+    return MCPMiddleware()
 
 
-def get_shared_mcp_middleware() -> "MCPMiddleware":
+def get_shared_mcp_middleware() -> MCPMiddleware:
     """Get or create the shared MCPMiddleware instance.
 
     This singleton pattern ensures MCP servers are only connected once,
@@ -20,12 +25,7 @@ def get_shared_mcp_middleware() -> "MCPMiddleware":
     Returns:
         The shared MCPMiddleware instance.
     """
-    global _shared_mcp_middleware
-    if _shared_mcp_middleware is None:
-        from namicode_cli.mcp.middleware import MCPMiddleware
-
-        _shared_mcp_middleware = MCPMiddleware()
-    return _shared_mcp_middleware
+    return _shared_mcp_middleware()
 
 
 def reset_shared_mcp_middleware() -> None:
@@ -33,13 +33,22 @@ def reset_shared_mcp_middleware() -> None:
 
     Call this when starting a new session or when MCP config changes.
     """
-    global _shared_mcp_middleware
-    _shared_mcp_middleware = None
+    _shared_mcp_middleware.cache_clear()
+
+
+def close_shared_mcp_middleware() -> None:
+    """Close the shared MCPMiddleware's server sessions, if it was created.
+
+    Call this when the CLI exits so stdio servers are shut down cleanly.
+    """
+    if _shared_mcp_middleware.cache_info().currsize:
+        _shared_mcp_middleware().close()
 
 
 __all__ = [
     "MCPConfig",
     "MCPServerConfig",
+    "close_shared_mcp_middleware",
     "get_shared_mcp_middleware",
     "reset_shared_mcp_middleware",
 ]
@@ -9,9 +9,15 @@ persistent connections for stateful MCP servers.
 
 import asyncio
 import contextlib
-from collections.abc import AsyncIterator, Awaitable, Callable
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from collections.abc import Awaitable, Callable, Coroutine
 from pathlib import Path
-from typing import Any, NotRequired, TypedDict
+from typing import Any, NotRequired
 
 from langchain.agents.middleware.types import (
     AgentMiddleware,
@@ -19,13 +25,28 @@ from langchain.agents.middleware.types import (
     ModelRequest,
     ModelResponse,
 )
-from langchain_core.tools import BaseTool
-from langgraph.runtime import Runtime
+from langchain_core.tools import BaseTool, StructuredTool, ToolException
 from mcp.client.session import ClientSession
 
 from namicode_cli.config.config import console
-from namicode_cli.mcp.client import MultiServerMCPClient
-from namicode_cli.mcp.config import MCPConfig
+from namicode_cli.mcp.client import MultiServerMCPClient, create_mcp_client
+from namicode_cli.mcp.config import MCPConfig, MCPServerConfig
+
+# On-disk tool metadata cache, rebuilt at startup once it is older than a day
+_TOOLS_CACHE_FILENAME = "mcp_tools_cache.json"
+_TOOLS_CACHE_MAX_AGE = 24 * 60 * 60  # seconds
+# Bump when the cached metadata entries change shape
+_TOOLS_CACHE_VERSION = 2
+
+# Connection retry policy for persistent MCP sessions
+_MAX_CONNECT_ATTEMPTS = 4
+_MAX_RECONNECT_DELAY = 30
+
+# Seconds to wait for sessions to close on shutdown
+_CLOSE_TIMEOUT = 5
+
+# Upper bound on tools described in the system prompt, across all servers
+_MAX_MCP_TOOLS_IN_PROMPT = 200
 
 
 class MCPState(AgentState):
@@ -35,13 +56,6 @@ class MCPState(AgentState):
     """List of MCP tools metadata (name, description, server)."""
 
 
-class MCPStateUpdate(TypedDict):
-    """State update for the MCP middleware."""
-
-    mcp_tools: list[dict[str, Any]]
-    """List of MCP tools metadata."""
-
-
 MCP_SYSTEM_PROMPT = """
 
 ## MCP (Model Context Protocol) Tools Available
@@ -58,7 +72,7 @@ You have access to external tools provided by MCP servers. These extend your cap
    - Format: `servername__toolname`
    - Example: `docs-langchain__search` calls the `search` tool from the `docs-langchain` server
 
-2. **Discovery**: All available MCP tools are listed above with their descriptions
+2. **Discovery**: Available MCP tools are listed above with their descriptions
    - Check the tool descriptions to understand what each tool does
    - Review the Parameters listed below each tool
 
@@ -87,6 +101,9 @@ You have access to external tools provided by MCP servers. These extend your cap
 Remember: MCP tools are powerful extensions. Always use the EXACT parameter names shown!
 """
 
+# Template halves around the single placeholder, split once at import
+_MCP_PROMPT_PREFIX, _MCP_PROMPT_SUFFIX = MCP_SYSTEM_PROMPT.split("{servers_list}")
+
 
 class MCPMiddleware(AgentMiddleware):
     """Middleware for integrating MCP servers with the agent.
@@ -94,8 +111,9 @@ class MCPMiddleware(AgentMiddleware):
     This middleware:
     - Loads MCP server configurations from ~/.nami/mcp.json
     - Discovers tools from configured MCP servers using langchain-mcp-adapters
+    - Registers one proxy per MCP tool with the agent at construction time
+    - Connects to each server the first time one of its tools is called
     - Maintains persistent sessions for stateful MCP servers
-    - Registers MCP tools with the agent
 
     Args:
         config_path: Optional path to mcp.json config file
@@ -103,160 +121,401 @@ class MCPMiddleware(AgentMiddleware):
 
     state_schema = MCPState
 
+    # Shared across instances: one event loop running on one daemon thread
+    _bg_loop: asyncio.AbstractEventLoop | None = None
+    _bg_thread: threading.Thread | None = None
+    _bg_lock = threading.Lock()
+
     def __init__(self, config_path: Path | None = None) -> None:
         """Initialize the MCP middleware.
 
-        Discovers MCP tools synchronously at init time so they can be
-        registered with the agent.
+        Tools must be known at init time so they can be registered with the
+        agent. Tool metadata saved by a previous run is served from
+        ~/.nami/mcp_tools_cache.json when it matches the current config and
+        is less than a day old; otherwise every server is contacted once to
+        discover its tools. Either
+        way the agent gets one proxy tool per MCP tool, and a server is only
+        connected when one of its tools is first called.
 
         Args:
             config_path: Optional path to mcp.json config file.
                        Defaults to ~/.nami/mcp.json
         """
         self.mcp_config = MCPConfig(config_path)
-        self._client: MultiServerMCPClient | None = None
+        # Long-lived client; its sessions are reused for discovery and tool calls
+        self._client: MultiServerMCPClient = create_mcp_client(self.mcp_config)
+        # Metadata of the tools registered with the agent
         self._tools_cache: list[dict[str, Any]] = []
         self.tools: list[BaseTool] = []
-        # Track persistent sessions for stateful servers
+        # Latest known tool metadata, written to the on-disk cache
+        self._tools_metadata: list[dict[str, Any]] = []
+        # Live tools of each connected server, keyed by tool name
+        self._server_tools: dict[str, dict[str, BaseTool]] = {}
+        self._server_locks: dict[str, asyncio.Lock] = {}
+        # Track persistent sessions for stateful servers. Each session is
+        # owned by a task on the background loop that exits once its event is set.
         self._sessions: dict[str, ClientSession] = {}
-        self._session_contexts: list[contextlib.AbstractAsyncContextManager[Any]] = []
-
-        # Discover tools synchronously at init time
-        self._discover_tools_sync()
+        self._session_tasks: dict[str, tuple[asyncio.Task[None], asyncio.Event]] = {}
+        # Rendered MCP system prompt section, built once the tools are known
+        self._cached_mcp_section: str | None = None
+        self._tools_cache_path = self.mcp_config.config_path.parent / _TOOLS_CACHE_FILENAME
+        self._warned_tools_truncated = False
+
+        self._discover_servers_meta()
+        if self._load_tools_metadata_cache() != "fresh" and self._servers:
+            # Stale metadata stays in place for servers that can't be reached
+            self._run_sync(self._discover_tools_async())
+
+        self._tools_cache = list(self._tools_metadata)
+        self.tools = [self._proxy_tool(tool) for tool in self._tools_cache]
+        self._refresh_mcp_section()
+
+    def _discover_servers_meta(self) -> None:
+        """Load configured server names and descriptions without connecting."""
+        self._servers: dict[str, MCPServerConfig] = self.mcp_config.list_servers()
+
+    def _refresh_mcp_section(self) -> None:
+        """Render the MCP system prompt section from the known servers and tools.
+
+        The registered tools don't change after init, so the section is built
+        here instead of on every model call. Call this again whenever
+        ``_tools_cache`` is modified.
+        """
+        if not self._servers:
+            self._cached_mcp_section = None
+            return
 
-    def _discover_tools_sync(self) -> None:
-        """Discover tools from all configured MCP servers synchronously.
+        tools_metadata = self._tools_cache
+        if len(tools_metadata) > _MAX_MCP_TOOLS_IN_PROMPT:
+            if not self._warned_tools_truncated:
+                console.print(
+                    f"[yellow]Warning: MCP servers expose {len(tools_metadata)} tools; "
+                    f"only the first {_MAX_MCP_TOOLS_IN_PROMPT} are listed in the "
+                    f"system prompt[/yellow]"
+                )
+                self._warned_tools_truncated = True
+            tools_metadata = tools_metadata[:_MAX_MCP_TOOLS_IN_PROMPT]
+        servers_list = self._format_servers_list(self._servers, tools_metadata)
+        self._cached_mcp_section = "".join(
+            (_MCP_PROMPT_PREFIX, servers_list, _MCP_PROMPT_SUFFIX)
+        )
+
+    def _tools_metadata_cache_key(self) -> str:
+        """Hash the server configuration the metadata cache was built from."""
+        config = {name: server.model_dump() for name, server in self._servers.items()}
+        payload = json.dumps([_TOOLS_CACHE_VERSION, config], sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _load_tools_metadata_cache(self) -> str | None:
+        """Load tool metadata saved by a previous process.
+
+        The cache is only used if it was built from the current server
+        configuration. Stale entries (older than a day) are loaded as a
+        fallback, and the caller rediscovers the tools before using them.
 
-        This runs at __init__ time to ensure tools are available when
-        the middleware is registered with the agent.
+        Returns:
+            "fresh" or "stale" if metadata was loaded, None otherwise
         """
-        servers = self.mcp_config.list_servers()
+        if not self._servers:
+            return None
 
-        if not servers:
-            return
+        try:
+            age = time.time() - self._tools_cache_path.stat().st_mtime
+            data = json.loads(self._tools_cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
 
-        # Use nest_asyncio to allow nested event loops
-        # This avoids ThreadPoolExecutor issues with Docker stdio on Windows
-        import nest_asyncio
+        if not isinstance(data, dict) or data.get("key") != self._tools_metadata_cache_key():
+            return None
 
-        nest_asyncio.apply()
+        self._tools_metadata = data.get("tools", [])
+        return "stale" if age > _TOOLS_CACHE_MAX_AGE else "fresh"
 
-        # Run async discovery
+    def _save_tools_metadata_cache(self) -> None:
+        """Persist discovered tool metadata for the next process start."""
+        data = {"key": self._tools_metadata_cache_key(), "tools": self._tools_metadata}
+
+        # Write to a temp file and rename so readers never see a partial file
+        tmp_path = self._tools_cache_path.with_suffix(".tmp")
         try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp_path, self._tools_cache_path)
+        except OSError:
+            pass
 
-        loop.run_until_complete(self._discover_tools_async())
+    def _proxy_tool(self, metadata: dict[str, Any]) -> BaseTool:
+        """Build the tool registered with the agent for one MCP tool.
 
-    async def _discover_tools_async(self) -> None:
-        """Async implementation of tool discovery using MultiServerMCPClient.
+        The proxy has the MCP tool's name, description and argument schema and
+        forwards each call to the server's live tool on the background loop.
+
+        Args:
+            metadata: Tool metadata entry, see `_tool_metadata`
 
-        Creates a single combined client and discovers tools from all servers.
-        Tools loaded this way will create sessions on-demand for each invocation.
+        Returns:
+            A tool that can be registered before the server is connected
         """
-        from langchain_mcp_adapters.tools import load_mcp_tools
+        server_name = metadata["server"]
+        tool_name = metadata["name"]
+
+        def call(**arguments: Any) -> tuple[Any, Any]:
+            return self._run_sync(self._call_tool(server_name, tool_name, arguments))
+
+        async def acall(**arguments: Any) -> tuple[Any, Any]:
+            return await self._run_async(self._call_tool(server_name, tool_name, arguments))
+
+        return StructuredTool(
+            name=tool_name,
+            description=metadata["description"],
+            args_schema=metadata.get("args_schema") or {"type": "object", "properties": {}},
+            func=call,
+            coroutine=acall,
+            response_format="content_and_artifact",
+        )
+
+    @classmethod
+    def _get_bg_loop(cls) -> asyncio.AbstractEventLoop:
+        """Get the process-wide MCP event loop, starting its thread on first use."""
+        with cls._bg_lock:
+            if cls._bg_loop is None:
+                cls._bg_loop = asyncio.new_event_loop()
+                cls._bg_thread = threading.Thread(
+                    target=cls._bg_loop.run_forever, name="mcp-loop", daemon=True
+                )
+                cls._bg_thread.start()
+        return cls._bg_loop
 
-        from namicode_cli.mcp.client import build_mcp_config_dict
+    def _run_sync(self, coro: Coroutine[Any, Any, Any], timeout: float | None = None) -> Any:
+        """Run an MCP coroutine to completion from synchronous code.
 
-        servers = self.mcp_config.list_servers()
+        Works whether or not the calling thread already has a running event
+        loop: the coroutine always runs on the shared background loop, so
+        sessions opened there stay bound to the same loop for the lifetime
+        of the process.
 
-        if not servers:
-            return
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait for the result, or None to wait forever
 
-        # Build combined config for all servers
-        config_dict = build_mcp_config_dict(self.mcp_config)
+        Returns:
+            The coroutine's result
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._get_bg_loop())
+        return future.result(timeout)
 
-        if not config_dict:
-            return
+    async def _run_async(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Await an MCP coroutine on the shared background loop.
 
-        # Create the combined client
-        self._client = MultiServerMCPClient(config_dict)
+        Args:
+            coro: Coroutine to run
 
-        all_tools: list[BaseTool] = []
+        Returns:
+            The coroutine's result
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._get_bg_loop())
+        return await asyncio.wrap_future(future)
 
-        # Load tools from each server with proper attribution
+    async def _discover_tools_async(self) -> None:
+        """Discover tools from every configured server and save their metadata."""
         # Prioritize Docker-based servers first (they have issues with Windows async)
-        server_names = list(servers.keys())
-        docker_servers = [
-            name for name in server_names if servers[name].command == "docker"
-        ]
-        other_servers = [name for name in server_names if name not in docker_servers]
-        ordered_servers = docker_servers + other_servers
+        docker_servers: list[str] = []
+        other_servers: list[str] = []
+        for name, config in self._servers.items():
+            (docker_servers if config.command == "docker" else other_servers).append(name)
 
-        for server_name in ordered_servers:
+        complete = True
+        for server_name in docker_servers + other_servers:
             try:
-                connection = config_dict.get(server_name)
-                if not connection:
-                    continue
-
-                # Load tools with server name prefix for proper attribution
-                server_tools = await load_mcp_tools(
-                    session=None,
-                    connection=connection,
-                    server_name=server_name,
-                )
-
-                if server_tools:
-                    all_tools.extend(server_tools)
-
-                    # Build metadata cache with correct server attribution
-                    for tool in server_tools:
-                        # Extract input schema for better parameter documentation
-                        input_schema = {}
-                        if hasattr(tool, "args_schema") and tool.args_schema:
-                            try:
-                                schema = tool.args_schema.model_json_schema()  # type: ignore
-                                input_schema = schema.get("properties", {})
-                            except Exception:
-                                pass
-
-                        self._tools_cache.append(
-                            {
-                                "name": tool.name,
-                                "description": tool.description or "",
-                                "server": server_name,
-                                "input_schema": input_schema,
-                            }
-                        )
-
-                    # console.print(
-                    #     f"[dim]MCP: Connected to '{server_name}' "
-                    #     f"({len(server_tools)} tools)[/dim]"
-                    # )
-
+                await self._load_server_tools(server_name, save=False)
             except Exception as e:
+                complete = False
                 console.print(
                     f"[yellow]Warning: Failed to connect to "
                     f"MCP server '{server_name}': {e}[/yellow]"
                 )
 
-        # Store all tools for the agent
-        self.tools = all_tools  # type: ignore
+        # Only cache a complete listing so failed servers are retried next start
+        if complete:
+            self._save_tools_metadata_cache()
 
-    async def on_session_start(
-        self,
-        runtime: Runtime,
-        *,
-        state: MCPState,
-    ) -> MCPStateUpdate | None:
-        """Store MCP tools metadata in state at session start.
+    async def _load_server_tools(
+        self, server_name: str, *, save: bool = True
+    ) -> dict[str, BaseTool]:
+        """Get the live tools of one MCP server, connecting on first use.
 
-        Tools are already discovered at __init__ time, so this just
-        stores the metadata in state for use in system prompt injection.
+        Runs on the background loop. The server's tool metadata is updated
+        from the live listing, so the next process registers any new tools;
+        the proxies registered with this agent are not changed.
 
         Args:
-            runtime: The LangGraph runtime instance
-            state: Current agent state
+            server_name: Name of the configured server
+            save: Rewrite the on-disk metadata cache after connecting. Batch
+                discovery passes False and saves once at the end.
 
         Returns:
-            State update with MCP tools metadata, or None if no tools
+            The server's tools, keyed by tool name
         """
-        if not self._tools_cache:
-            return None
+        from langchain_mcp_adapters.tools import load_mcp_tools
+
+        lock = self._server_locks.setdefault(server_name, asyncio.Lock())
+        async with lock:
+            tools = self._server_tools.get(server_name)
+            if tools is not None:
+                return tools
+
+            session = await self._ensure_session(server_name)
+
+            # Load tools with server name prefix for proper attribution.
+            # Tools keep a reference to the session, so calls reuse it.
+            server_tools = await load_mcp_tools(session, server_name=server_name)
+            tools = self._server_tools[server_name] = {tool.name: tool for tool in server_tools}
 
-        return {"mcp_tools": self._tools_cache}
+        # Replace any earlier entries for this server so re-discovery can't duplicate them
+        self._tools_metadata = [
+            *(tool for tool in self._tools_metadata if tool["server"] != server_name),
+            *(_tool_metadata(tool, server_name) for tool in tools.values()),
+        ]
+        if save:
+            self._save_tools_metadata_cache()
+        return tools
+
+    async def _call_tool(
+        self, server_name: str, tool_name: str, arguments: dict[str, Any]
+    ) -> tuple[Any, Any]:
+        """Call a live MCP tool on the background loop.
+
+        Args:
+            server_name: Server the tool belongs to
+            tool_name: Name of the tool
+            arguments: Tool call arguments
+
+        Returns:
+            The tool's (content, artifact) pair
+
+        Raises:
+            ToolException: If the server no longer provides the tool or the
+                tool reports an error
+        """
+        tool = (await self._load_server_tools(server_name)).get(tool_name)
+        if tool is None:
+            msg = f"MCP server '{server_name}' no longer provides the tool '{tool_name}'"
+            raise ToolException(msg)
+        try:
+            # Call the adapter's coroutine directly to keep the artifact
+            return await tool.coroutine(**arguments)  # type: ignore[attr-defined]
+        except ToolException:
+            raise
+        except Exception:
+            # The session may be broken; drop it so the next call reconnects
+            await self._close_session(server_name)
+            raise
+
+    async def _ensure_session(self, server_name: str) -> ClientSession:
+        """Get the persistent session for a server, connecting if needed.
+
+        Failed connection attempts are retried with exponential backoff (1s,
+        2s, 4s, ... capped at 30s) before giving up. anyio and the MCP client
+        raise ExceptionGroup, McpError or OSError here, so any error counts.
+
+        Args:
+            server_name: Name of the configured server
+
+        Returns:
+            An initialized client session
+
+        Raises:
+            ConnectionError: If the server can't be reached after all retries
+        """
+        session = self._sessions.get(server_name)
+        if session is not None:
+            return session
+
+        for attempt in range(_MAX_CONNECT_ATTEMPTS):
+            ready: asyncio.Future[ClientSession] = asyncio.get_running_loop().create_future()
+            stop = asyncio.Event()
+            task = asyncio.create_task(
+                self._hold_session(server_name, ready, stop), name=f"mcp-session-{server_name}"
+            )
+            try:
+                session = await ready
+            except Exception as e:
+                if attempt == _MAX_CONNECT_ATTEMPTS - 1:
+                    msg = f"Could not connect to MCP server '{server_name}': {e}"
+                    raise ConnectionError(msg) from e
+                await asyncio.sleep(min(2**attempt, _MAX_RECONNECT_DELAY))
+                continue
+
+            self._sessions[server_name] = session
+            self._session_tasks[server_name] = (task, stop)
+            return session
+
+        msg = f"Could not connect to MCP server '{server_name}'"
+        raise ConnectionError(msg)
+
+    async def _hold_session(
+        self,
+        server_name: str,
+        ready: asyncio.Future[ClientSession],
+        stop: asyncio.Event,
+    ) -> None:
+        """Open a server session and keep it open until ``stop`` is set.
+
+        Runs as its own task because the session context, and the anyio task
+        group inside it, must be exited by the task that entered it.
+
+        Args:
+            server_name: Name of the configured server
+            ready: Receives the session, or the error if connecting fails
+            stop: Set to close the session
+        """
+        try:
+            async with self._client.session(server_name) as session:
+                ready.set_result(session)
+                await stop.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+        finally:
+            if not ready.done():
+                msg = f"MCP session for '{server_name}' closed while connecting"
+                ready.set_exception(ConnectionError(msg))
+            # Evict a session that ended on its own (e.g. the server exited)
+            owner = self._session_tasks.get(server_name)
+            if owner is not None and owner[0] is asyncio.current_task():
+                self._forget_session(server_name)
+
+    def _forget_session(self, server_name: str) -> tuple[asyncio.Task[None], asyncio.Event] | None:
+        """Drop a server's session and the tools bound to it.
+
+        Returns:
+            The session's owning task and stop event, if it had a session
+        """
+        self._sessions.pop(server_name, None)
+        # Loaded tools hold the session, so reload them on next use
+        self._server_tools.pop(server_name, None)
+        return self._session_tasks.pop(server_name, None)
+
+    async def _close_session(self, server_name: str) -> None:
+        """Close one server's session in its owning task and drop its tools."""
+        owner = self._forget_session(server_name)
+        if owner is not None:
+            task, stop = owner
+            stop.set()
+            await asyncio.wait([task])
+
+    async def _close_sessions(self) -> None:
+        """Close every open session."""
+        await asyncio.gather(*map(self._close_session, list(self._session_tasks)))
+
+    def close(self) -> None:
+        """Close all persistent MCP sessions, e.g. stdio server processes.
+
+        Safe to call more than once; a later tool call reconnects.
+        """
+        if not self._session_tasks:
+            return
+        with contextlib.suppress(TimeoutError):
+            self._run_sync(self._close_sessions(), timeout=_CLOSE_TIMEOUT)
 
     def _format_servers_list(
         self,
@@ -272,37 +531,72 @@ class MCPMiddleware(AgentMiddleware):
         Returns:
             Formatted string for system prompt
         """
-        lines = []
+        # Bucket tools by server in one pass instead of rescanning per server
+        tools_by_server: dict[str, list[dict[str, Any]]] = {}
+        for tool in tools_metadata:
+            tools_by_server.setdefault(tool["server"], []).append(tool)
+
+        out = io.StringIO()
 
         for name, config in servers.items():
-            lines.append(f"\n**{name}** ({config.transport})")
+            out.write(f"\n\n**{name}** ({config.transport})")
 
             if config.description:
-                lines.append(f"  {config.description}")
+                out.write(f"\n  {config.description}")
 
             # List tools from this server
-            server_tools = [t for t in tools_metadata if t["server"] == name]
+            server_tools = tools_by_server.get(name, ())
 
             if server_tools:
-                lines.append(f"  Tools ({len(server_tools)}):")
+                out.write(f"\n  Tools ({len(server_tools)}):")
                 for tool in server_tools:
                     # Format tool with parameters
-                    tool_line = f"    - {tool['name']}: {tool['description']}"
-                    lines.append(tool_line)
+                    out.write(f"\n    - {tool['name']}: {tool['description']}")
 
                     # Show required parameters from input schema
-                    input_schema = tool.get("input_schema", {})
+                    input_schema = tool.get("input_schema")
                     if input_schema:
-                        param_names = list(input_schema.keys())
-                        if param_names:
-                            params_str = ", ".join(param_names)
-                            lines.append(f"      Parameters: {params_str}")
+                        out.write(f"\n      Parameters: {', '.join(input_schema)}")
             else:
-                lines.append("  (No tools available)")
+                out.write("\n  (No tools available)")
 
-            lines.append("")
+            out.write("\n")
 
-        return "\n".join(lines)
+        # Drop the separator written ahead of the first server
+        return out.getvalue()[1:]
+
+    def _build_injected_system_prompt(self, request: ModelRequest) -> str | None:
+        """Build the system prompt with the MCP section appended.
+
+        Args:
+            request: The model request being processed
+
+        Returns:
+            The new system prompt, or None if there is nothing to inject
+        """
+        mcp_section = self._cached_mcp_section
+        if not mcp_section:
+            return None
+        if request.system_prompt:
+            return f"{request.system_prompt}\n\n{mcp_section}"
+        return mcp_section
+
+    def _inject_mcp(self, request: ModelRequest) -> ModelRequest:
+        """Add the MCP prompt section to a model request.
+
+        The MCP tools themselves are registered through ``self.tools``, so
+        ``create_agent`` already includes them in the request.
+
+        Args:
+            request: The model request being processed
+
+        Returns:
+            The updated request (or the original if there is nothing to add)
+        """
+        system_prompt = self._build_injected_system_prompt(request)
+        if system_prompt is None:
+            return request
+        return request.override(system_prompt=system_prompt)
 
     def wrap_model_call(
         self,
@@ -320,36 +614,7 @@ class MCPMiddleware(AgentMiddleware):
         Returns:
             The model response from the handler
         """
-        # Get MCP tools metadata from state
-        mcp_tools = request.state.get("mcp_tools", [])
-
-        # Build updated request
-        updated_request = request
-
-        # Add MCP tools to the request if we have any
-        if self.tools:
-            # Merge MCP tools with existing tools
-            updated_tools = list(request.tools) + self.tools
-            updated_request = updated_request.override(tools=updated_tools)
-
-        # Inject MCP info into system prompt if we have tools
-        if mcp_tools:
-            # Get servers configuration
-            servers = self.mcp_config.list_servers()
-
-            # Format the MCP section
-            servers_list = self._format_servers_list(servers, mcp_tools)
-            mcp_section = MCP_SYSTEM_PROMPT.format(servers_list=servers_list)
-
-            # Inject into system prompt
-            if updated_request.system_prompt:
-                system_prompt = updated_request.system_prompt + "\n\n" + mcp_section
-            else:
-                system_prompt = mcp_section
-
-            updated_request = updated_request.override(system_prompt=system_prompt) # type: ignore
-
-        return handler(updated_request)
+        return handler(self._inject_mcp(request))
 
     async def awrap_model_call(
         self,
@@ -365,36 +630,37 @@ class MCPMiddleware(AgentMiddleware):
         Returns:
             The model response from the handler
         """
-        # Get MCP tools metadata from state
-        mcp_tools = request.state.get("mcp_tools", [])
-
-        # Build updated request
-        updated_request = request
-
-        # Add MCP tools to the request if we have any
-        if self.tools:
-            # Merge MCP tools with existing tools
-            updated_tools = list(request.tools) + self.tools
-            updated_request = updated_request.override(tools=updated_tools)
-
-        # Inject MCP info into system prompt if we have tools
-        if mcp_tools:
-            # Get servers configuration
-            servers = self.mcp_config.list_servers()
-
-            # Format the MCP section
-            servers_list = self._format_servers_list(servers, mcp_tools)
-            mcp_section = MCP_SYSTEM_PROMPT.format(servers_list=servers_list)
-
-            # Inject into system prompt
-            if updated_request.system_prompt:
-                system_prompt = updated_request.system_prompt + "\n\n" + mcp_section
-            else:
-                system_prompt = mcp_section
+        return await handler(self._inject_mcp(request))
+
+
+def _tool_metadata(tool: BaseTool, server_name: str) -> dict[str, Any]:
+    """Build the prompt metadata entry for one MCP tool.
 
-            updated_request = updated_request.override(system_prompt=system_prompt) # type: ignore
+    Args:
+        tool: Tool loaded from the MCP server
+        server_name: Server the tool belongs to
 
-        return await handler(updated_request)
+    Returns:
+        Dict with the tool's name, description, server, parameter names for
+        the prompt and the full JSON schema for the proxy tool
+    """
+    # Extract input schema for better parameter documentation
+    args_schema: dict[str, Any] = {}
+    if isinstance(tool.args_schema, dict):
+        args_schema = tool.args_schema
+    elif tool.args_schema is not None:
+        try:
+            args_schema = tool.args_schema.model_json_schema()
+        except Exception:
+            pass
+
+    return {
+        "name": tool.name,
+        "description": tool.description or "",
+        "server": server_name,
+        "input_schema": args_schema.get("properties", {}),
+        "args_schema": args_schema,
+    }
 
 
 __all__ = ["MCPMiddleware"]
@@ -7,9 +7,12 @@ and all subagents, enabling:
 3. Shared context between main agent and subagents
 """
 
-import json
-from collections.abc import Awaitable, Callable
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterable
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, NotRequired, TypedDict
 
 from langchain.agents.middleware.types import (
@@ -35,7 +38,7 @@ class MemoryEntry(TypedDict):
     timestamp: str
     """ISO timestamp when the memory was written."""
 
-    tags: NotRequired[list[str]]
+    tags: NotRequired[tuple[str, ...]]
     """Optional tags for categorization."""
 
 
@@ -49,6 +52,14 @@ class SharedMemoryState(AgentState):
 # Module-level shared memory store
 _shared_memory_store: InMemoryStore | None = None
 
+# Key indexes over the store, kept in sync by write_memory/delete_memory.
+# Dicts are used as insertion-ordered sets so listings keep write order.
+_all_keys: dict[str, None] = {}
+_tag_index: defaultdict[str, dict[str, None]] = defaultdict(dict)
+
+# Bumped on every change to the store; keys the rendered list_memories cache
+_store_version = 0
+
 
 def get_shared_memory_store() -> InMemoryStore:
     """Get or create the shared memory store.
@@ -64,13 +75,42 @@ def get_shared_memory_store() -> InMemoryStore:
 
 def reset_shared_memory_store() -> None:
     """Reset the shared memory store (for new sessions)."""
-    global _shared_memory_store
+    global _shared_memory_store, _store_version
     _shared_memory_store = None
+    _store_version += 1
+    _all_keys.clear()
+    _tag_index.clear()
+
+
+def _unindex_tags(key: str, tags: Iterable[str]) -> None:
+    """Remove a key from the tag index entries of its previous tags."""
+    for tag in tags:
+        tagged = _tag_index.get(tag)
+        if tagged is not None:
+            tagged.pop(key, None)
+            if not tagged:
+                del _tag_index[tag]
 
 
 # Namespace for shared memories
 MEMORY_NAMESPACE = ("shared_memory",)
 
+# Last formatted timestamp, as (epoch second, ISO string)
+_ts_cache: tuple[int, str] = (0, "")
+
+
+def _utc_timestamp() -> str:
+    """Get the current UTC time as a second-resolution ISO string.
+
+    The string is rebuilt at most once per second, so bursts of writes
+    reuse it.
+    """
+    global _ts_cache
+    sec = int(time.time())
+    if sec != _ts_cache[0]:
+        _ts_cache = (sec, datetime.fromtimestamp(sec, timezone.utc).isoformat())
+    return _ts_cache[1]
+
 
 def write_memory(
     key: str,
@@ -89,17 +129,28 @@ def write_memory(
     Returns:
         Confirmation message.
     """
+    global _store_version
     store = get_shared_memory_store()
 
     entry: MemoryEntry = {
         "content": content,
-        "author": author,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        # Authors and tags come from a small vocabulary; intern to share them
+        "author": sys.intern(author),
+        "timestamp": _utc_timestamp(),
     }
     if tags:
-        entry["tags"] = tags
+        # A tuple is smaller than a list and can't be mutated by the caller
+        entry["tags"] = tuple(sys.intern(tag) for tag in tags)
+
+    previous = store.get(MEMORY_NAMESPACE, key)
+    if previous is not None:
+        _unindex_tags(key, previous.value.get("tags", ()))
 
     store.put(MEMORY_NAMESPACE, key, entry)
+    _all_keys[key] = None
+    for tag in tags or ():
+        _tag_index[tag][key] = None
+    _store_version += 1
 
     return f"Memory '{key}' written successfully by {author}."
 
@@ -123,7 +174,7 @@ def read_memory(key: str) -> str:
     author = entry.get("author", "unknown")
     timestamp = entry.get("timestamp", "unknown")
     content = entry.get("content", "")
-    tags = entry.get("tags", [])
+    tags = entry.get("tags", ())
 
     result = f"Memory: {key}\n"
     result += f"Author: {author}\n"
@@ -144,35 +195,52 @@ def list_memories(tag_filter: str | None = None) -> str:
     Returns:
         Formatted list of all memories with metadata.
     """
-    store = get_shared_memory_store()
+    if tag_filter:
+        tag_filter = sys.intern(tag_filter)
+    return _render_memories(_store_version, tag_filter)
 
-    # Get all items in the namespace
-    items = store.search(MEMORY_NAMESPACE, limit=100)
 
-    if not items:
+@lru_cache(maxsize=32)
+def _render_memories(version: int, tag_filter: str | None) -> str:
+    """Render the memory listing for one version of the store.
+
+    Args:
+        version: Store version the listing is cached under.
+        tag_filter: Optional tag to filter memories by.
+
+    Returns:
+        Formatted list of all memories with metadata.
+    """
+    if not _all_keys:
         return "No memories stored yet."
 
+    # Only visit the keys carrying the requested tag
+    keys = _tag_index.get(tag_filter, {}) if tag_filter else _all_keys
+
     result_lines = ["# Shared Memories\n"]
 
-    for item in items:
+    for key in list(keys):
+        item = get_shared_memory_store().get(MEMORY_NAMESPACE, key)
+        if item is None:
+            continue
         entry = item.value
-        key = item.key
+        tags = entry.get("tags", ())
+        # Guard against index drift before doing any per-entry formatting work
+        if tag_filter and tag_filter not in tags:
+            continue
+
         author = entry.get("author", "unknown")
         timestamp = entry.get("timestamp", "unknown")
-        tags = entry.get("tags", [])
         content_preview = entry.get("content", "")[:100]
 
-        # Apply tag filter if specified
-        if tag_filter and tag_filter not in tags:
-            continue
-
-        result_lines.append(f"## {key}")
-        result_lines.append(f"- **Author**: {author}")
-        result_lines.append(f"- **Written**: {timestamp}")
-        if tags:
-            result_lines.append(f"- **Tags**: {', '.join(tags)}")
-        result_lines.append(f"- **Preview**: {content_preview}...")
-        result_lines.append("")
+        tag_line = f"- **Tags**: {', '.join(tags)}\n" if tags else ""
+        result_lines.append(
+            f"## {key}\n"
+            f"- **Author**: {author}\n"
+            f"- **Written**: {timestamp}\n"
+            f"{tag_line}"
+            f"- **Preview**: {content_preview}...\n"
+        )
 
     if len(result_lines) == 1:
         return f"No memories found with tag '{tag_filter}'."
@@ -189,6 +257,7 @@ def delete_memory(key: str) -> str:
     Returns:
         Confirmation or error message.
     """
+    global _store_version
     store = get_shared_memory_store()
     item = store.get(MEMORY_NAMESPACE, key)
 
@@ -196,10 +265,37 @@ def delete_memory(key: str) -> str:
         return f"Memory '{key}' not found."
 
     store.delete(MEMORY_NAMESPACE, key)
+    _all_keys.pop(key, None)
+    _unindex_tags(key, item.value.get("tags", ()))
+    # Bumped after the mutation so a listing rendered mid-delete is never
+    # cached under the new version
+    _store_version += 1
     return f"Memory '{key}' deleted successfully."
 
 
+# Memory tools per author ID, shared by every middleware for that author
+_memory_tools_cache: dict[str, list[BaseTool]] = {}
+
+
 def _create_memory_tools(author_id: str) -> list[BaseTool]:
+    """Get the memory tools for an author, building them on first use.
+
+    The tools only close over ``author_id``, so middlewares for the same
+    author (e.g. repeatedly spawned subagents) can share them.
+
+    Args:
+        author_id: The identifier for the author (e.g., 'main-agent' or 'subagent:researcher').
+
+    Returns:
+        List of memory tools.
+    """
+    tools = _memory_tools_cache.get(author_id)
+    if tools is None:
+        tools = _memory_tools_cache[author_id] = _build_memory_tools(author_id)
+    return list(tools)
+
+
+def _build_memory_tools(author_id: str) -> list[BaseTool]:
     """Create memory tools with the specified author ID baked in.
 
     Args:
@@ -330,6 +426,12 @@ All memories track who wrote them. When you read a memory, you'll see:
 - Any tags associated with it
 """
 
+# Appended to a non-empty base prompt; joined once here rather than per call
+_SHARED_MEMORY_PROMPT_SUFFIX = "\n\n" + SHARED_MEMORY_SYSTEM_PROMPT
+
+# Number of distinct base prompts whose combined prompt is kept per middleware
+_PROMPT_CACHE_SIZE = 16
+
 
 class SharedMemoryMiddleware(AgentMiddleware):
     """Middleware that provides shared memory tools to agents.
@@ -362,6 +464,38 @@ class SharedMemoryMiddleware(AgentMiddleware):
         self.author_id = author_id
         self.include_system_prompt = include_system_prompt
         self.tools = _create_memory_tools(author_id)
+        # id(base prompt) -> (base prompt, combined prompt), evicted FIFO.
+        # Holding the base string keeps its id from being reused while cached.
+        self._prompt_cache: dict[int, tuple[str, str]] = {}
+
+    def _system_prompt_for(self, base_prompt: str | None) -> str:
+        """Append the shared memory instructions to a base system prompt.
+
+        Args:
+            base_prompt: The request's system prompt, if any.
+
+        Returns:
+            The combined system prompt, built once per distinct base prompt.
+        """
+        if not base_prompt:
+            return SHARED_MEMORY_SYSTEM_PROMPT
+
+        key = id(base_prompt)
+        cached = self._prompt_cache.get(key)
+        if cached is not None and cached[0] is base_prompt:
+            return cached[1]
+
+        system_prompt = base_prompt + _SHARED_MEMORY_PROMPT_SUFFIX
+        if len(self._prompt_cache) >= _PROMPT_CACHE_SIZE:
+            del self._prompt_cache[next(iter(self._prompt_cache))]
+        self._prompt_cache[key] = (base_prompt, system_prompt)
+        return system_prompt
+
+    def _compose_prompt(self, request: ModelRequest) -> ModelRequest:
+        """Add the shared memory instructions to a request's system prompt."""
+        if not self.include_system_prompt:
+            return request
+        return request.override(system_prompt=self._system_prompt_for(request.system_prompt))
 
     def wrap_model_call(
         self,
@@ -369,14 +503,7 @@ class SharedMemoryMiddleware(AgentMiddleware):
         handler: Callable[[ModelRequest], ModelResponse],
     ) -> ModelResponse:
         """Inject shared memory instructions into the system prompt."""
-        if self.include_system_prompt:
-            system_prompt = (
-                request.system_prompt + "\n\n" + SHARED_MEMORY_SYSTEM_PROMPT
-                if request.system_prompt
-                else SHARED_MEMORY_SYSTEM_PROMPT
-            )
-            return handler(request.override(system_prompt=system_prompt))
-        return handler(request)
+        return handler(self._compose_prompt(request))
 
     async def awrap_model_call(
         self,
@@ -384,14 +511,7 @@ class SharedMemoryMiddleware(AgentMiddleware):
         handler: Callable[[ModelRequest], Awaitable[ModelResponse]],
     ) -> ModelResponse:
         """(async) Inject shared memory instructions into the system prompt."""
-        if self.include_system_prompt:
-            system_prompt = (
-                request.system_prompt + "\n\n" + SHARED_MEMORY_SYSTEM_PROMPT
-                if request.system_prompt
-                else SHARED_MEMORY_SYSTEM_PROMPT
-            )
-            return await handler(request.override(system_prompt=system_prompt))
-        return await handler(request)
+        return await handler(self._compose_prompt(request))
 
 
 __all__ = [
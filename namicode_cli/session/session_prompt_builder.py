@@ -9,6 +9,8 @@ This module builds prompts in the correct order as specified in Task.md:
 6. Continuation instruction
 """
 
+import io
+import os
 from pathlib import Path
 from typing import Any
 
@@ -40,6 +42,17 @@ You are continuing from a previous session. The information above represents the
 
 Continue working on the task from the current state."""
 
+# NAMI.md contents keyed by path, with the mtime (ns) they were read at
+_NAMI_MD_CACHE: dict[str, tuple[int, str]] = {}
+
+# Project instruction files, in lookup order, relative to the project root
+_NAMI_MD_RELPATHS = (
+    "NAMI.md",
+    "CLAUDE.md",
+    os.path.join(".nami", "NAMI.md"),
+    os.path.join(".claude", "CLAUDE.md"),
+)
+
 
 def build_continuation_prompt(
     session_data: SessionData,
@@ -66,49 +79,46 @@ def build_continuation_prompt(
     Returns:
         List of messages ready to send to the agent
     """
-    # Start with system message containing all context
-    system_parts = []
+    # Write the system message sections straight into one buffer
+    buf = io.StringIO()
 
     # 1. Static system instructions
-    system_parts.append(system_prompt)
+    buf.write(system_prompt)
 
     # 2. NAMI.md contents (project rules - AUTHORITATIVE)
     if nami_md_content:
-        system_parts.append("\n\n## Project Rules (NAMI.md)\n\n" + nami_md_content)
+        buf.write("\n\n## Project Rules (NAMI.md)\n\n")
+        buf.write(nami_md_content)
 
     # 3. memory.md contents (session memory - declarative facts)
-    if session_data.memory:
-        system_parts.append("\n\n## Session Memory\n\n" + session_data.memory)
-    else:
-        system_parts.append(
-            "\n\n## Session Memory\n\n(No session memory available - this is a fresh start)"
-        )
+    buf.write("\n\n## Session Memory\n\n")
+    buf.write(
+        session_data.memory
+        or "(No session memory available - this is a fresh start)"
+    )
 
     # 4. Workspace state (current git + filesystem)
     if workspace_state:
-        workspace_section = format_workspace_state_for_prompt(workspace_state)
-        system_parts.append("\n\n" + workspace_section)
+        buf.write("\n\n")
+        buf.write(format_workspace_state_for_prompt(workspace_state))
 
     # 5. Task state from meta
-    task_section = _format_task_state(session_data)
-    system_parts.append("\n\n" + task_section)
+    buf.write("\n\n")
+    buf.write(_format_task_state(session_data))
 
     # 6. Continuation instruction
-    system_parts.append("\n\n" + CONTINUATION_INSTRUCTION)
+    buf.write("\n\n")
+    buf.write(CONTINUATION_INSTRUCTION)
 
     # Build final system message
-    full_system_message = "\n".join(system_parts)
-
-    # Start messages list with system message
-    messages: list[BaseMessage] = [SystemMessage(content=full_system_message)]
+    full_system_message = buf.getvalue()
 
     # 7. Add recent messages from conversation (if any)
     # Filter out system messages from recent history (we have a new system message)
-    for msg in session_data.messages:
-        if not isinstance(msg, SystemMessage):
-            messages.append(msg)
-
-    return messages
+    return [
+        SystemMessage(content=full_system_message),
+        *(msg for msg in session_data.messages if not isinstance(msg, SystemMessage)),
+    ]
 
 
 def _format_task_state(session_data: SessionData) -> str:
@@ -157,19 +167,25 @@ def load_nami_md(project_root: Path | None) -> str | None:
     if not project_root:
         return None
 
-    # Try NAMI.md first
-    nami_md_paths = [
-        project_root / "NAMI.md",
-        project_root / "CLAUDE.md",
-        project_root / ".nami" / "NAMI.md",
-        project_root / ".claude" / "CLAUDE.md",
-    ]
-
-    for path in nami_md_paths:
-        if path.exists():
-            try:
-                return path.read_text(encoding="utf-8")
-            except OSError:
-                continue
+    root = os.fspath(project_root)
+    for relpath in _NAMI_MD_RELPATHS:
+        path = os.path.join(root, relpath)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+
+        # Reuse the cached content while the file is unchanged
+        cached = _NAMI_MD_CACHE.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                content = f.read()
+        except OSError:
+            continue
+        _NAMI_MD_CACHE[path] = (mtime_ns, content)
+        return content
 
     return None
@@ -5,7 +5,13 @@ focusing on outcomes rather than dialogue.
 """
 
 from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
 
 SUMMARIZATION_SYSTEM_PROMPT = """You are a session summarizer. Your job is to create a concise, declarative memory.md file from a conversation history.
 
@@ -58,6 +64,15 @@ Use markdown with clear sections:
 
 Focus on **what happened** and **what was learned**, not **how** or **why** in detail."""
 
+# Sessions smaller than either threshold get a template memory instead of an LLM call
+_MIN_MESSAGES_FOR_LLM = 4
+_MIN_CHARS_FOR_LLM = 200
+
+# Huge sessions send the opening messages (the user's original goal) plus the
+# most recent ones, to bound latency without losing what the session was for
+_MAX_MESSAGES_FOR_LLM = 100
+_HEAD_MESSAGES_FOR_LLM = 4
+
 
 def summarize_messages_to_memory(
     messages: list[BaseMessage],
@@ -77,8 +92,20 @@ def summarize_messages_to_memory(
     if not messages:
         return "# Session Memory\n\n(No activity yet)\n"
 
+    # Trivially small sessions don't warrant a model round-trip
+    if len(messages) < _MIN_MESSAGES_FOR_LLM or (
+        sum(len(str(msg.content)) for msg in messages) < _MIN_CHARS_FOR_LLM
+    ):
+        return _build_template_memory(messages, current_task)
+
     # Build conversation summary for the LLM
-    conversation_summary = _build_conversation_summary(messages)
+    llm_messages = messages
+    if len(messages) > _MAX_MESSAGES_FOR_LLM:
+        llm_messages = (
+            messages[:_HEAD_MESSAGES_FOR_LLM]
+            + messages[-(_MAX_MESSAGES_FOR_LLM - _HEAD_MESSAGES_FOR_LLM) :]
+        )
+    conversation_summary = _build_conversation_summary(llm_messages)
 
     # Create prompt for summarization
     user_prompt = f"""Summarize this conversation into a declarative memory.md file.
@@ -115,6 +142,39 @@ Failed to generate summary: {e}
 """
 
 
+def _build_template_memory(messages: list[BaseMessage], current_task: str | None) -> str:
+    """Build memory.md content for a small session without calling the LLM.
+
+    Args:
+        messages: Messages to summarize
+        current_task: Optional current task description
+
+    Returns:
+        memory.md content as a string
+    """
+    tools_used: dict[str, None] = {}
+    files: dict[str, None] = {}
+    for msg in messages:
+        if not isinstance(msg, AIMessage):
+            continue
+        for tool_call in msg.tool_calls:
+            tools_used[tool_call["name"]] = None
+            path = tool_call["args"].get("file_path") or tool_call["args"].get("path")
+            if isinstance(path, str):
+                files[path] = None
+
+    sections = [
+        "# Session Memory",
+        f"## Current Goal\n{current_task or 'Not specified'}",
+    ]
+    if files:
+        sections.append("## Files Touched\n" + "\n".join(f"- `{path}`" for path in files))
+    if tools_used:
+        sections.append("## Tools Used\n" + "\n".join(f"- {name}" for name in tools_used))
+    sections.append(f"## Message Count\n{len(messages)} messages in conversation")
+    return "\n\n".join(sections) + "\n"
+
+
 def _build_conversation_summary(messages: list[BaseMessage], max_length: int = 10000) -> str:
     """Build a textual summary of the conversation for the summarizer.
 
@@ -125,10 +185,14 @@ def _build_conversation_summary(messages: list[BaseMessage], max_length: int = 1
     Returns:
         Formatted conversation summary
     """
-    lines = []
+    lines: list[str] = []
+    size = 0  # len("\n".join(lines)) + 1 once any line is added
 
     for i, msg in enumerate(messages):
-        msg_type = msg.__class__.__name__
+        # Stop once the budget is spent - later lines would be truncated anyway
+        if size - 1 > max_length:
+            break
+
         content = str(msg.content) if msg.content else "(empty)"
 
         # Truncate very long messages
@@ -136,22 +200,22 @@ def _build_conversation_summary(messages: list[BaseMessage], max_length: int = 1
             content = content[:497] + "..."
 
         # Format based on message type
-        if msg_type == "HumanMessage":
-            lines.append(f"[{i+1}] User: {content}")
-        elif msg_type == "AIMessage":
+        if isinstance(msg, HumanMessage):
+            size += _append_line(lines, f"[{i+1}] User: {content}")
+        elif isinstance(msg, AIMessage):
             # Check for tool calls
-            if hasattr(msg, 'tool_calls') and msg.tool_calls: # type: ignore
-                tool_names = [tc.get('name', 'unknown') for tc in msg.tool_calls] # type: ignore
-                lines.append(f"[{i+1}] Assistant: (called tools: {', '.join(tool_names)})")
+            if msg.tool_calls:
+                tool_names = [tc.get('name', 'unknown') for tc in msg.tool_calls]
+                size += _append_line(lines, f"[{i+1}] Assistant: (called tools: {', '.join(tool_names)})")
             if content and not content.startswith("[") and len(content) > 10:
-                lines.append(f"[{i+1}] Assistant: {content}")
-        elif msg_type == "ToolMessage":
-            tool_name = getattr(msg, 'name', 'unknown')
+                size += _append_line(lines, f"[{i+1}] Assistant: {content}")
+        elif isinstance(msg, ToolMessage):
+            tool_name = msg.name or 'unknown'
             # Include tool result if it's not too long
             if len(content) < 200:
-                lines.append(f"[{i+1}] Tool({tool_name}): {content}")
+                size += _append_line(lines, f"[{i+1}] Tool({tool_name}): {content}")
             else:
-                lines.append(f"[{i+1}] Tool({tool_name}): (output length: {len(content)} chars)")
+                size += _append_line(lines, f"[{i+1}] Tool({tool_name}): (output length: {len(content)} chars)")
 
     summary = "\n".join(lines)
 
@@ -162,6 +226,12 @@ def _build_conversation_summary(messages: list[BaseMessage], max_length: int = 1
     return summary
 
 
+def _append_line(lines: list[str], line: str) -> int:
+    """Append a line and return how much it adds to the joined length."""
+    lines.append(line)
+    return len(line) + 1
+
+
 def should_trigger_summarization(
     message_count: int,
     recent_limit: int = 8,
@@ -181,12 +251,4 @@ def should_trigger_summarization(
     Returns:
         True if summarization should be triggered
     """
-    # Trigger if we have way more messages than the recent limit
-    if message_count > recent_limit * 2:
-        return True
-
-    # Trigger when task is marked complete
-    if task_status == "complete":
-        return True
-
-    return False
+    return message_count > recent_limit * 2 or task_status == "complete"
@@ -23,18 +23,24 @@ description: Structured approach to conducting thorough web research
 
 from __future__ import annotations
 
+import json
+import os
 import re
-from typing import TYPE_CHECKING, TypedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TypedDict
 from nami_deepagents.middleware.skills import SkillMetadata
-from nami_deepagents.backends.filesystem import FilesystemBackend
-from nami_deepagents.middleware.skills import _list_skills as list_skills_from_backend
-
-if TYPE_CHECKING:
-    from pathlib import Path
+from nami_deepagents.middleware.skills import _parse_skill_metadata
 
 # Maximum size for SKILL.md files (10MB)
 MAX_SKILL_FILE_SIZE = 10 * 1024 * 1024
 
+# Bytes read from the start of each SKILL.md; enough for any real frontmatter
+_SKILL_HEAD_SIZE = 8192
+
+# Same delimiters as the middleware's frontmatter parser, applied to raw bytes
+_FRONTMATTER_RE = re.compile(rb"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+
 
 class ExtendedSkillMetadata(SkillMetadata):
     """Extended skill metadata for CLI display, adds source tracking."""
@@ -45,14 +51,175 @@ class ExtendedSkillMetadata(SkillMetadata):
 # Re-export for CLI commands
 __all__ = ["SkillMetadata", "list_skills"]
 
+# Mtime of a skills directory plus (path, mtime, size) of its SKILL.md files,
+# used to detect changes
+_SkillsSignature = tuple[int, tuple[tuple[str, int, int], ...]]
+
+# Parsed skills per (directory, source), with the signature they were read at
+_skill_cache: dict[tuple[str, str], tuple[_SkillsSignature, list[ExtendedSkillMetadata]]] = {}
+
+_skills_index_loaded = False
+
+
+def _skills_index_path() -> Path:
+    """Path of the on-disk copy of _skill_cache, resolved at use time.
+
+    The index lets new processes skip parsing unchanged skills.
+    """
+    return Path.home() / ".nami" / "skills_index.json"
+
+
+def _load_skills_index() -> None:
+    """Seed the in-memory skill cache from the index saved by a previous process."""
+    global _skills_index_loaded
+    if _skills_index_loaded:
+        return
+    _skills_index_loaded = True
+
+    try:
+        entries = json.loads(_skills_index_path().read_text(encoding="utf-8"))
+        for entry in entries:
+            dir_mtime, skill_stats = entry["signature"]
+            signature = (
+                dir_mtime,
+                tuple((path, mtime, size) for path, mtime, size in skill_stats),
+            )
+            _skill_cache.setdefault(
+                (entry["dir"], entry["source"]), (signature, entry["skills"])
+            )
+    except (OSError, ValueError, TypeError, KeyError):
+        return
+
+
+def _save_skills_index() -> None:
+    """Persist the skill cache, dropping directories that no longer exist."""
+    entries = [
+        {"dir": skills_dir, "source": source, "signature": signature, "skills": skills}
+        for (skills_dir, source), (signature, skills) in _skill_cache.items()
+        if os.path.isdir(skills_dir)
+    ]
+
+    # Write to a temp file and rename so readers never see a partial file
+    index_path = _skills_index_path()
+    tmp_path = index_path.with_suffix(".tmp")
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(entries), encoding="utf-8")
+        os.replace(tmp_path, index_path)
+    except OSError:
+        pass
+
+
+def _skills_signature(skills_dir: Path) -> _SkillsSignature:
+    """Stat a skills directory and every SKILL.md directly under its subdirectories.
+
+    Adding or removing a skill changes the directory mtime, and editing a
+    skill changes its SKILL.md mtime. The size is included too, so an edit
+    within the same timestamp tick on coarse filesystems is still noticed.
+
+    Raises:
+        OSError: If the skills directory can't be stat'ed (e.g. it doesn't exist).
+    """
+    dir_mtime = skills_dir.stat().st_mtime_ns
+    skill_stats = []
+    for skill_md in skills_dir.glob("*/SKILL.md"):
+        try:
+            stat = skill_md.stat()
+        except OSError:
+            continue
+        skill_stats.append((str(skill_md), stat.st_mtime_ns, stat.st_size))
+    return dir_mtime, tuple(sorted(skill_stats))
+
+
+def _scan_skills_dir(skills_dir: Path) -> list[SkillMetadata]:
+    """Parse the SKILL.md frontmatter of every skill directly under a directory.
+
+    Only the head of each SKILL.md is read. The rest of the file is read
+    only when the frontmatter doesn't close within the head.
+
+    Args:
+        skills_dir: Skills directory to scan.
+
+    Returns:
+        Skill metadata from successfully parsed SKILL.md files.
+    """
+    skills: list[SkillMetadata] = []
+    try:
+        entries = list(os.scandir(skills_dir.resolve()))
+    except OSError:
+        return skills
+
+    for entry in entries:
+        try:
+            # Don't follow symlinks out of the skills directory
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+        except OSError:
+            continue
+
+        # Match the backend's path format: absolute, with forward slashes
+        skill_md_path = entry.path.replace("\\", "/") + "/SKILL.md"
+        try:
+            # O_NOFOLLOW, as FilesystemBackend uses, so a symlinked SKILL.md is skipped
+            fd = os.open(skill_md_path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+            with os.fdopen(fd, "rb") as f:
+                if os.fstat(f.fileno()).st_size > MAX_SKILL_FILE_SIZE:
+                    continue
+                raw = f.read(_SKILL_HEAD_SIZE)
+                match = _FRONTMATTER_RE.match(raw)
+                if match is not None:
+                    raw = match.group(0)
+                else:
+                    # Frontmatter may run past the head, so parse the whole file
+                    raw += f.read()
+        except OSError:
+            continue
+
+        try:
+            content = raw.decode("utf-8")
+        except UnicodeDecodeError:
+            continue
+
+        metadata = _parse_skill_metadata(
+            content=content, skill_path=skill_md_path, directory_name=entry.name
+        )
+        if metadata:
+            skills.append(metadata)
+
+    return skills
+
+
+def _rescan_skills_dir(
+    skills_dir: Path, source: str, signature: _SkillsSignature
+) -> list[ExtendedSkillMetadata]:
+    """Parse one skills directory and store the result in the cache.
+
+    Args:
+        skills_dir: Skills directory to scan.
+        source: Source label stored on each skill ("user" or "project").
+        signature: Signature of the directory taken before the scan.
+
+    Returns:
+        Skill metadata for the directory, tagged with ``source``.
+    """
+    skills = _scan_skills_dir(skills_dir)
+    for skill in skills:
+        # Add source field for CLI display. The scan returns fresh dicts,
+        # so they can be extended in place instead of copied.
+        skill["source"] = source  # type: ignore[typeddict-unknown-key]
+    extended_skills: list[ExtendedSkillMetadata] = skills  # type: ignore[assignment]
+    _skill_cache[(str(skills_dir), source)] = (signature, extended_skills)
+    return extended_skills
+
 
 def list_skills(
     *, user_skills_dir: Path | None = None, project_skills_dir: Path | None = None
 ) -> list[ExtendedSkillMetadata]:
     """List skills from user and/or project directories.
 
-    This is a CLI-specific wrapper around the prebuilt middleware's skill loading
-    functionality. It uses FilesystemBackend to load skills from local directories.
+    This is a CLI-specific counterpart to the prebuilt middleware's skill loading.
+    It reads skills straight from local directories and parses their frontmatter
+    with the middleware's parser.
 
     When both directories are provided, project skills with the same name as
     user skills will override them (project skills take precedence).
@@ -63,28 +230,50 @@ def list_skills(
 
     Returns:
         Merged list of skill metadata from both sources, with project skills
-        taking precedence over user skills when names conflict.
+        taking precedence over user skills when names conflict. The entries
+        are copies, so callers may modify them without affecting the cache.
     """
+    # User skills first (foundation), project skills second (override/augment)
+    sources = [
+        (skills_dir, source)
+        for skills_dir, source in ((user_skills_dir, "user"), (project_skills_dir, "project"))
+        if skills_dir
+    ]
+
+    _load_skills_index()
+
+    # Reuse cached parses where the signature still matches; only the
+    # directories that changed are rescanned
+    results: list[list[ExtendedSkillMetadata]] = []
+    misses: list[tuple[int, Path, str, _SkillsSignature]] = []
+    for skills_dir, source in sources:
+        # The signature's stat doubles as the existence check
+        try:
+            signature = _skills_signature(skills_dir)
+        except OSError:
+            continue
+        cached = _skill_cache.get((str(skills_dir), source))
+        if cached is not None and cached[0] == signature:
+            results.append(cached[1])
+        else:
+            misses.append((len(results), skills_dir, source, signature))
+            results.append([])
+
+    if len(misses) > 1:
+        # Scanning is I/O-bound, so the directories are read concurrently
+        with ThreadPoolExecutor(max_workers=len(misses)) as executor:
+            scanned = list(executor.map(lambda miss: _rescan_skills_dir(*miss[1:]), misses))
+    else:
+        scanned = [_rescan_skills_dir(*miss[1:]) for miss in misses]
+    for (index, *_), skills in zip(misses, scanned):
+        results[index] = skills
+
     all_skills: dict[str, ExtendedSkillMetadata] = {}
+    for skills in results:
+        for skill in skills:
+            all_skills[skill["name"]] = skill
 
-    # Load user skills first (foundation)
-    if user_skills_dir and user_skills_dir.exists():
-        user_backend = FilesystemBackend(root_dir=str(user_skills_dir))
-        user_skills = list_skills_from_backend(backend=user_backend, source_path=".")
-        for skill in user_skills:
-            # Add source field for CLI display
-            extended_skill: ExtendedSkillMetadata = {**skill, "source": "user"}
-            all_skills[skill["name"]] = extended_skill
-
-    # Load project skills second (override/augment)
-    if project_skills_dir and project_skills_dir.exists():
-        project_backend = FilesystemBackend(root_dir=str(project_skills_dir))
-        project_skills = list_skills_from_backend(
-            backend=project_backend, source_path="."
-        )
-        for skill in project_skills:
-            # Add source field for CLI display
-            extended_skill: ExtendedSkillMetadata = {**skill, "source": "project"}
-            all_skills[skill["name"]] = extended_skill
+    if misses:
+        _save_skills_index()
 
-    return list(all_skills.values())
+    return [ExtendedSkillMetadata(**skill) for skill in all_skills.values()]
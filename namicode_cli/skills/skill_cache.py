@@ -0,0 +1,174 @@
+"""Persistent cache of generated skills.
+
+Generating a skill costs a full agent run. When enabled with
+``NAMICODE_SKILL_CACHE=1``, every file the agent generated for a skill
+(SKILL.md plus any supporting files) is stored in ``~/.nami/skill_cache.db``
+keyed by the normalized skill name and description, and repeat requests
+reuse them instead of calling the LLM again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+
+SKILL_CACHE_PATH = Path.home() / ".nami" / "skill_cache.db"
+
+# Cached skills older than this are regenerated (30 days)
+SKILL_CACHE_TTL = 30 * 24 * 60 * 60
+
+_FRONTMATTER_RE = re.compile(r"\A---\s*\n(.*?)\n---", re.DOTALL)
+
+
+def skill_cache_enabled() -> bool:
+    """Check whether the skill generation cache is turned on."""
+    return os.environ.get("NAMICODE_SKILL_CACHE") == "1"
+
+
+def skill_cache_key(skill_name: str, description: str | None) -> str:
+    """Build the cache key for a skill request.
+
+    Args:
+        skill_name: Name of the skill.
+        description: Optional user-provided description.
+
+    Returns:
+        Hex digest of the normalized name and description.
+    """
+    normalized = f"{skill_name.lower()}|{(description or '').strip().lower()}"
+    return hashlib.blake2b(normalized.encode("utf-8")).hexdigest()
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the cache database, creating it if needed."""
+    SKILL_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(SKILL_CACHE_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS skills "
+        "(key TEXT PRIMARY KEY, content TEXT NOT NULL, created_at REAL NOT NULL)"
+    )
+    return conn
+
+
+def get_cached_skill(key: str) -> dict[str, str] | None:
+    """Look up a cached skill.
+
+    Args:
+        key: Key from ``skill_cache_key``.
+
+    Returns:
+        The cached files as relative path -> content, or None on a miss, an
+        expired entry, or a cache error.
+    """
+    try:
+        with closing(_connect()) as conn:
+            row = conn.execute(
+                "SELECT content, created_at FROM skills WHERE key = ?", (key,)
+            ).fetchone()
+    except (OSError, sqlite3.Error):
+        return None
+
+    if row is None or time.time() - row[1] > SKILL_CACHE_TTL:
+        return None
+    try:
+        files = json.loads(row[0])
+    except ValueError:
+        # Entry from before whole skills were cached
+        return None
+    if not isinstance(files, dict) or "SKILL.md" not in files:
+        return None
+    return files
+
+
+def set_cached_skill(key: str, files: dict[str, str]) -> None:
+    """Store a generated skill. Cache errors are ignored.
+
+    Args:
+        key: Key from ``skill_cache_key``.
+        files: Generated files as relative path -> content, from ``read_skill_files``.
+    """
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO skills (key, content, created_at) VALUES (?, ?, ?)",
+                (key, json.dumps(files), time.time()),
+            )
+    except (OSError, sqlite3.Error):
+        pass
+
+
+def adapt_cached_skill(content: str, skill_name: str, description: str | None) -> str:
+    """Point a cached SKILL.md at the requested skill name and description.
+
+    Only the frontmatter ``name`` and ``description`` lines are rewritten;
+    the body is reused as-is.
+
+    Args:
+        content: Cached SKILL.md content.
+        skill_name: Name of the skill being created.
+        description: Optional user-provided description.
+
+    Returns:
+        SKILL.md content for the requested skill.
+    """
+    match = _FRONTMATTER_RE.match(content)
+    if match is None:
+        return content
+
+    # Callable replacements so backslashes in user text aren't read as escapes
+    frontmatter = re.sub(
+        r"(?m)^name:.*$", lambda _: f"name: {skill_name}", match.group(1)
+    )
+    if description:
+        frontmatter = re.sub(
+            r"(?m)^description:.*$",
+            lambda _: f"description: {description.strip()}",
+            frontmatter,
+        )
+    return content[: match.start(1)] + frontmatter + content[match.end(1) :]
+
+
+def read_skill_files(skill_dir: Path) -> dict[str, str] | None:
+    """Read every file of a generated skill for caching.
+
+    Args:
+        skill_dir: Directory the skill was generated into.
+
+    Returns:
+        Relative POSIX path -> content, or None if a file isn't UTF-8 text
+        (such skills aren't cached).
+    """
+    files: dict[str, str] = {}
+    for path in skill_dir.rglob("*"):
+        if not path.is_file():
+            continue
+        try:
+            files[path.relative_to(skill_dir).as_posix()] = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+    return files
+
+
+def write_skill_files(skill_dir: Path, files: dict[str, str]) -> None:
+    """Recreate a cached skill's files under a skill directory.
+
+    Args:
+        skill_dir: Directory of the skill being created.
+        files: Relative POSIX path -> content, from ``get_cached_skill``.
+
+    Raises:
+        ValueError: If a cached path would land outside ``skill_dir``.
+    """
+    root = skill_dir.resolve()
+    for relative_path, content in files.items():
+        target = (skill_dir / relative_path).resolve()
+        if not target.is_relative_to(root):
+            raise ValueError(f"Cached skill file escapes the skill directory: {relative_path}")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content, encoding="utf-8")
@@ -1,132 +1,54 @@
 import argparse
+import asyncio
 import json
-import re
+import os
+import string
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
-from namicode_cli.config.config import COLORS, Settings, console
+from rich.table import Table
+from rich.text import Text
+
+from namicode_cli.config.config import COLORS, console, settings
 from namicode_cli.skills.load import list_skills
-from namicode_cli.config.model_create import create_model
-from nami_deepagents.graph import create_deep_agent
-from namicode_cli.tools import web_search
-from nami_deepagents.backends import CompositeBackend
-from nami_deepagents.backends.filesystem import FilesystemBackend
-from namicode_cli.skills.skill_system_prompt import SKILL_CREATION
+from namicode_cli.skills.skill_cache import (
+    adapt_cached_skill,
+    get_cached_skill,
+    read_skill_files,
+    set_cached_skill,
+    skill_cache_enabled,
+    skill_cache_key,
+    write_skill_files,
+)
+from namicode_cli.skills.skill_system_prompt import (
+    SKILL_CREATION_DYNAMIC,
+    SKILL_CREATION_STABLE,
+)
 from typing import Optional
 
+# Upper bound on skills generated at once by `nami skills create a b c ...`
+_MAX_CONCURRENT_CREATES = 10
 
-def _get_skill_query(
-    skill_name: str,
-    description: str | None = None,
-) -> str:
-    """Build a prompt for skill generation.
-
-    Args:
-        skill_name: Name of the skill.
-        description: Optional user-provided description.
-        research_context: Web search results for context.
-
-    Returns:
-        Complete prompt string for the LLM.
-    """
-
-    description_hint = ""
-    if description:
-        description_hint = f"""
-The user has provided this description: "{description}"
-Use this to guide the skill's purpose and content.
-"""
-
-    return f"""
-    Create a comprehensive, production-ready SKILL.md file for a skill named "{skill_name}".
-
-    {description_hint}
-"""
-
-
-async def _generate_skill(
-    skill_name: str,
-    base_dir: Path,
-    description: Optional[str] = None,
-) -> str | None:
-    """Generate skill content using the configured LLM and return SKILL.md content."""
-
-    try:
-        console.print(
-            "[dim]Generating comprehensive skill content...[/dim]",
-            style=COLORS["dim"],
-        )
-        skill_dir = base_dir / skill_name
-
-        skill_query_prompt = _get_skill_query(skill_name, description)
-
-        skill_creation_agent = create_deep_agent(
-            name="Skill-Creation-Agent",
-            model=create_model(),
-            system_prompt=SKILL_CREATION.format(skill_dir=skill_dir),
-            tools=[web_search],
-            backend=FilesystemBackend(root_dir=skill_dir, virtual_mode=True),
-        )
-
-        # Invoke the agent (this writes SKILL.md to disk)
-        response = await skill_creation_agent.ainvoke(
-            {"messages": [{"role": "user", "content": skill_query_prompt}]}
-        )
-
-        responded = str(response["messages"][-1].content).strip()
-
-        if responded:
-            # Now read the actual SKILL.md file
-            skill_file = skill_dir / "SKILL.md"
-            if not skill_file.exists():
-                console.print(
-                    "[yellow]Warning: SKILL.md was not created by the agent.[/yellow]"
-                )
-                return None
-
-            skill_content = skill_file.read_text(encoding="utf-8").strip()
-
-            # Validate frontmatter
-            if not skill_content.startswith("---"):
-                console.print(
-                    "[yellow]Warning: SKILL.md missing valid frontmatter. Adding defaults.[/yellow]"
-                )
-                skill_content = f"""---
-                name: {skill_name}
-                description: {description}
-                ---
-
-                {skill_content}
-                """
-                skill_file.write_text(skill_content, encoding="utf-8")
-
-            console.print(
-                "[dim]Skill content generated and normalized successfully.[/dim]",
-                style=COLORS["dim"],
-            )
-            return skill_content
+# Prebuilt messages printed from several commands (no markup parsing per print)
+_ERR_BOTH_SCOPES = Text.assemble(
+    ("Error:", "bold red"), " Cannot specify both --project and --global flags."
+)
+_ERR_NOT_IN_PROJECT = Text.assemble(("Error:", "bold red"), " Not in a project directory.")
+_NOT_IN_PROJECT = Text("Not in a project directory.", style="yellow")
+_PROJECT_SKILLS_NEED_GIT = Text(
+    "Project skills require a .git directory in the project root.",
+    style=f"dim {COLORS['dim']}",
+)
+_CANCELLED = Text("Cancelled.", style=COLORS["dim"])
 
-        else:
-            return "Skill creation failed"
+# Deletes every allowed skill/agent name character; anything left over is invalid
+_ALLOWED_NAME_CHARS_TABLE = str.maketrans("", "", string.ascii_letters + string.digits + "-_")
 
-    except Exception as e:
-        console.print(
-            f"[yellow]Warning: LLM generation failed ({e}), using static template.[/yellow]"
-        )
-        return None
 
-
-def _get_static_template(skill_name: str) -> str:
-    """Get the static template for skill creation (fallback).
-
-    Args:
-        skill_name: Name of the skill.
-
-    Returns:
-        Static SKILL.md template content.
-    """
-    skill_title = skill_name.replace("-", " ").replace("_", " ").title()
-    return f"""---
+# Fallback SKILL.md used when LLM generation fails
+_STATIC_TEMPLATE: Final[str] = """---
 name: {skill_name}
 description: [Brief description of what this skill does]
 ---
@@ -230,14 +152,187 @@ def example():
 """
 
 
-def _create(
+def _get_skill_query(
+    skill_name: str,
+    description: str | None = None,
+) -> str:
+    """Build a prompt for skill generation.
+
+    Args:
+        skill_name: Name of the skill.
+        description: Optional user-provided description.
+        research_context: Web search results for context.
+
+    Returns:
+        Complete prompt string for the LLM.
+    """
+
+    description_hint = ""
+    if description:
+        description_hint = f"""
+The user has provided this description: "{description}"
+Use this to guide the skill's purpose and content.
+"""
+
+    return f"""
+    Create a comprehensive, production-ready SKILL.md file for a skill named "{skill_name}".
+
+    {description_hint}
+"""
+
+
+async def _generate_skill(
+    skill_name: str,
+    base_dir: Path,
+    description: Optional[str] = None,
+    stream: bool = True,
+) -> str | None:
+    """Generate skill content using the configured LLM and return SKILL.md content.
+
+    With NAMICODE_SKILL_CACHE=1, a previously generated skill for the same
+    normalized name and description is reused instead of running the agent.
+
+    With stream=False the agent's reply is printed in one block, labeled with
+    the skill name, once generation finishes. Used when several skills are
+    generated at once so their output doesn't interleave.
+    """
+
+    try:
+        skill_dir = base_dir / skill_name
+
+        cache_key = skill_cache_key(skill_name, description) if skill_cache_enabled() else None
+        if cache_key is not None:
+            cached = get_cached_skill(cache_key)
+            if cached is not None:
+                skill_content = adapt_cached_skill(cached["SKILL.md"], skill_name, description)
+                write_skill_files(skill_dir, {**cached, "SKILL.md": skill_content})
+                console.print(
+                    "[dim]Reused a previously generated skill from the cache.[/dim]",
+                    style=COLORS["dim"],
+                )
+                return skill_content
+
+        console.print(
+            f"[dim]Generating comprehensive skill content for '{skill_name}'...[/dim]",
+            style=COLORS["dim"],
+        )
+
+        skill_query_prompt = _get_skill_query(skill_name, description)
+
+        # Imported here so list/info commands don't load the agent stack
+        from langchain_core.messages import AIMessageChunk
+        from nami_deepagents.backends.filesystem import FilesystemBackend
+        from nami_deepagents.graph import create_deep_agent
+
+        from namicode_cli.config.model_create import create_model
+        from namicode_cli.tools import web_search
+
+        skill_creation_agent = create_deep_agent(
+            name="Skill-Creation-Agent",
+            model=create_model(),
+            system_prompt=SKILL_CREATION_STABLE
+            + SKILL_CREATION_DYNAMIC.format(skill_dir=skill_dir),
+            tools=[web_search],
+            backend=FilesystemBackend(root_dir=skill_dir, virtual_mode=True),
+        )
+
+        # Stream the agent (this writes SKILL.md to disk) so its output shows
+        # up as it is produced. Only the latest AI message is kept, matching
+        # the final response `ainvoke` would have returned.
+        chunks: list[str] = []
+        current_id = None
+        async for message, _metadata in skill_creation_agent.astream(
+            {"messages": [{"role": "user", "content": skill_query_prompt}]},
+            stream_mode="messages",
+        ):
+            if not isinstance(message, AIMessageChunk):
+                continue
+            if message.id != current_id:
+                current_id = message.id
+                chunks.clear()
+            text = message.text
+            if text:
+                chunks.append(text)
+                if stream:
+                    console.print(text, end="", markup=False, highlight=False)
+
+        responded = "".join(chunks).strip()
+        if stream and chunks:
+            console.print()
+        elif responded:
+            console.print(f"Skill '{skill_name}':", style=COLORS["primary"], markup=False)
+            console.print(responded, markup=False, highlight=False)
+
+        if responded:
+            # Now read the actual SKILL.md file
+            skill_file = skill_dir / "SKILL.md"
+            if not skill_file.exists():
+                console.print(
+                    "[yellow]Warning: SKILL.md was not created by the agent.[/yellow]"
+                )
+                return None
+
+            raw = skill_file.read_bytes().strip()
+            skill_content = raw.decode("utf-8")
+
+            # Validate frontmatter on the raw bytes
+            if not raw.startswith(b"---"):
+                console.print(
+                    "[yellow]Warning: SKILL.md missing valid frontmatter. Adding defaults.[/yellow]"
+                )
+                skill_content = f"""---
+                name: {skill_name}
+                description: {description}
+                ---
+
+                {skill_content}
+                """
+                skill_file.write_text(skill_content, encoding="utf-8")
+            elif cache_key is not None:
+                # Only well-formed output is cached, with all generated files
+                skill_files = read_skill_files(skill_dir)
+                if skill_files is not None:
+                    set_cached_skill(cache_key, skill_files)
+
+            console.print(
+                "[dim]Skill content generated and normalized successfully.[/dim]",
+                style=COLORS["dim"],
+            )
+            return skill_content
+
+        else:
+            return "Skill creation failed"
+
+    except Exception as e:
+        console.print(
+            f"[yellow]Warning: LLM generation failed ({e}), using static template.[/yellow]"
+        )
+        return None
+
+
+def _get_static_template(skill_name: str) -> str:
+    """Get the static template for skill creation (fallback).
+
+    Args:
+        skill_name: Name of the skill.
+
+    Returns:
+        Static SKILL.md template content.
+    """
+    skill_title = skill_name.replace("-", " ").replace("_", " ").title()
+    return _STATIC_TEMPLATE.format_map({"skill_name": skill_name, "skill_title": skill_title})
+
+
+async def _create(
     skill_name: str,
     agent: str,
     project: bool = False,
     global_scope: bool = False,
     ask: bool = True,
+    description: str | None = None,
+    stream: bool = True,
 ) -> None:
-    """Create a new skill with a template SKILL.md file.
+    """Create a new skill, generating SKILL.md with the LLM or a static template.
 
     Args:
         skill_name: Name of the skill to create.
@@ -245,6 +340,8 @@ def _create(
         project: If True, create in project skills directory.
         global_scope: If True, create in global skills directory.
         ask: If True and neither project nor global_scope is specified, prompt user interactively.
+        description: Optional description to guide skill generation.
+        stream: If True, stream the agent's output as it is generated.
     """
     # Validate skill name first
     is_valid, error_msg = _validate_name(skill_name)
@@ -258,9 +355,7 @@ def _create(
 
     # Determine scope - either from flags or by asking
     if project and global_scope:
-        console.print(
-            "[bold red]Error:[/bold red] Cannot specify both --project and --global flags."
-        )
+        console.print(_ERR_BOTH_SCOPES)
         return
 
     use_project = project
@@ -268,20 +363,16 @@ def _create(
         # Ask user interactively
         scope = _ask_scope("create")
         if scope is None:
-            console.print("Cancelled.", style=COLORS["dim"])
+            console.print(_CANCELLED)
             return
         use_project = scope == "project"
     # If global_scope is True, use_project remains False
 
     # Determine target directory
-    settings = Settings.from_environment()
     if use_project:
         if not settings.project_root:
-            console.print("[bold red]Error:[/bold red] Not in a project directory.")
-            console.print(
-                "[dim]Project skills require a .git directory in the project root.[/dim]",
-                style=COLORS["dim"],
-            )
+            console.print(_ERR_NOT_IN_PROJECT)
+            console.print(_PROJECT_SKILLS_NEED_GIT)
             return
         skills_dir = settings.ensure_project_skills_dir()
     else:
@@ -305,16 +396,23 @@ def _create(
     skill_dir.mkdir(parents=True, exist_ok=True)
 
     # Try to generate content and scripts with LLM, fall back to static template
-    content = _generate_skill(skill_name, skill_dir)
+    content = await _generate_skill(
+        skill_name,
+        base_dir=skills_dir,  # type: ignore[arg-type]
+        description=description,
+        stream=stream,
+    )
     if content is None:
         content = _get_static_template(skill_name)
         used_llm = False
     else:
         used_llm = True
 
-    # Write SKILL.md
+    # Write SKILL.md. Generated content is already on disk: the agent wrote
+    # it (or the cache hit did), so only the template needs writing.
     skill_md = skill_dir / "SKILL.md"
-    skill_md.write_text(content, encoding="utf-8")
+    if not used_llm or not skill_md.exists():
+        skill_md.write_text(content, encoding="utf-8")
 
     console.print(
         f"✓ Skill '{skill_name}' created successfully!", style=COLORS["primary"]
@@ -343,9 +441,72 @@ def _create(
         )
 
 
+async def _create_many(
+    skill_names: list[str],
+    agent: str,
+    project: bool = False,
+    global_scope: bool = False,
+    ask: bool = True,
+    description: str | None = None,
+) -> None:
+    """Create several skills, generating them concurrently.
+
+    The scope is resolved once up front so interactive prompts don't
+    interleave; each skill is then created with `_create`. With ask=False
+    the default scope (project when in a project, else global) is used.
+    When more than one skill is created, each agent's output is printed in
+    one labeled block instead of streamed.
+
+    Args:
+        skill_names: Names of the skills to create.
+        agent: Agent identifier for skills
+        project: If True, create in project skills directory.
+        global_scope: If True, create in global skills directory.
+        ask: If True and neither project nor global_scope is specified, prompt user interactively.
+        description: Optional description to guide generation of every skill.
+    """
+    # Drop repeated names so two tasks never race on the same directory
+    skill_names = list(dict.fromkeys(skill_names))
+
+    if not project and not global_scope:
+        scope = _ask_scope("create", assume_default=not ask)
+        if scope is None:
+            console.print(_CANCELLED)
+            return
+        project = scope == "project"
+        global_scope = not project
+
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_CREATES)
+
+    async def create_one(skill_name: str) -> None:
+        async with semaphore:
+            await _create(
+                skill_name,
+                agent=agent,
+                project=project,
+                global_scope=global_scope,
+                ask=False,
+                description=description,
+                # Concurrent streams would interleave in the console
+                stream=len(skill_names) == 1,
+            )
+
+    await asyncio.gather(*(create_one(name) for name in skill_names))
+
+
+@lru_cache(maxsize=16)
+def _resolved_base(base_dir: Path) -> Path:
+    """Resolve a skills base directory once per CLI run."""
+    return base_dir.resolve()
+
+
 def _validate_skill_path(skill_dir: Path, base_dir: Path) -> tuple[bool, str]:
     """Validate that the resolved skill directory is within the base directory.
 
+    A not-yet-created directory directly under base_dir (the `_create` case)
+    is checked lexically, since there is nothing on disk to resolve. Anything
+    else is resolved so symlinks pointing outside the base are caught.
+
     Args:
         skill_dir: The skill directory path to validate
         base_dir: The base skills directory that should contain skill_dir
@@ -354,41 +515,50 @@ def _validate_skill_path(skill_dir: Path, base_dir: Path) -> tuple[bool, str]:
         Tuple of (is_valid, error_message). If valid, error_message is empty.
     """
     try:
-        # Resolve both paths to their canonical form
+        normalized_skill = os.path.normpath(skill_dir)
+        normalized_base = os.path.normpath(base_dir)
+        if (
+            os.path.dirname(normalized_skill) == normalized_base
+            and not os.path.lexists(normalized_skill)
+        ):
+            return True, ""
+
+        # Resolve to canonical form; the base is stable for the whole run
         resolved_skill = skill_dir.resolve()
-        resolved_base = base_dir.resolve()
+        resolved_base = _resolved_base(base_dir)
 
-        # Check if skill_dir is within base_dir
-        # Use is_relative_to if available (Python 3.9+), otherwise use string comparison
-        if hasattr(resolved_skill, "is_relative_to"):
-            if not resolved_skill.is_relative_to(resolved_base):
-                return False, f"Skill directory must be within {base_dir}"
-        else:
-            # Fallback for older Python versions
-            try:
-                resolved_skill.relative_to(resolved_base)
-            except ValueError:
-                return False, f"Skill directory must be within {base_dir}"
+        if not resolved_skill.is_relative_to(resolved_base):
+            return False, f"Skill directory must be within {base_dir}"
 
         return True, ""
     except (OSError, RuntimeError) as e:
         return False, f"Invalid path: {e}"
 
 
-def _ask_scope(operation: str = "use", allow_both: bool = False) -> str | None:
+def _ask_scope(
+    operation: str = "use", allow_both: bool = False, assume_default: bool = False
+) -> str | None:
     """Ask user whether to use project or global scope.
 
+    When stdin is not a TTY (or assume_default is set), the prompt's default
+    answer is returned without asking so scripted runs never block.
+
     Args:
         operation: The operation being performed (e.g., "create", "use", "list")
         allow_both: If True, add a "both" option (for list/info commands)
+        assume_default: If True, skip the prompt and return the default answer
 
     Returns:
         "project", "global", or "both" (if allow_both=True), or None if user cancels
     """
     # Check if we're in a project directory
-    settings = Settings.from_environment()
     in_project = settings.project_root is not None
 
+    if assume_default or not sys.stdin.isatty():
+        if not in_project:
+            return "global"
+        return "both" if allow_both else "project"
+
     console.print(
         f"\nWhere do you want to {operation} skills?", style=COLORS["primary"]
     )
@@ -419,10 +589,7 @@ def _ask_scope(operation: str = "use", allow_both: bool = False) -> str | None:
         console.print(
             "[yellow]Not in a project directory. Using global skills.[/yellow]"
         )
-        console.print(
-            "[dim]Project skills require a .git directory in the project root.[/dim]",
-            style=COLORS["dim"],
-        )
+        console.print(_PROJECT_SKILLS_NEED_GIT)
         return "global"
 
 
@@ -439,23 +606,45 @@ def _validate_name(name: str) -> tuple[bool, str]:
     if not name or not name.strip():
         return False, "cannot be empty"
 
+    # Fast path: only allowed characters, so no traversal or separators either
+    if not name.translate(_ALLOWED_NAME_CHARS_TABLE):
+        return True, ""
+
     # Check for path traversal sequences
     if ".." in name:
         return False, "name cannot contain '..' (path traversal)"
 
-    # Check for absolute paths
-    if name.startswith(("/", "\\")):
-        return False, "name cannot be an absolute path"
-
-    # Check for path separators
+    # Check for absolute paths and path separators
     if "/" in name or "\\" in name:
+        if name[0] in "/\\":
+            return False, "name cannot be an absolute path"
         return False, "name cannot contain path separators"
 
-    # Only allow alphanumeric, hyphens, underscores
-    if not re.match(r"^[a-zA-Z0-9_-]+$", name):
-        return False, "name can only contain letters, numbers, hyphens, and underscores"
+    # Anything else is outside alphanumeric, hyphens, underscores
+    return False, "name can only contain letters, numbers, hyphens, and underscores"
 
-    return True, ""
+
+def _skills_table(skills: list[Any]) -> Table:
+    """Build the table for one section of the skills listing.
+
+    Args:
+        skills: Skills to render, in display order.
+
+    Returns:
+        Table with one row (name, description, location) per skill.
+    """
+    table = Table(show_header=True, header_style="bold", style=COLORS["dim"])
+    table.add_column("Name", style=f"bold {COLORS['primary']}", no_wrap=True)
+    table.add_column("Description", style=COLORS["dim"])
+    table.add_column("Location", style=COLORS["dim"])
+    for skill in skills:
+        # Text cells so brackets in names/descriptions aren't read as markup
+        table.add_row(
+            Text(skill["name"]),
+            Text(skill["description"]),
+            Text(f"{Path(skill['path']).parent}/"),
+        )
+    return table
 
 
 def _list(
@@ -469,15 +658,12 @@ def _list(
         global_scope: If True, show only global skills.
         ask: If True and no flags specified, prompt user interactively.
     """
-    settings = Settings.from_environment()
     user_skills_dir = settings.get_user_skills_dir(agent)
     project_skills_dir = settings.get_project_skills_dir()
 
     # Determine what to show - from flags or by asking
     if project and global_scope:
-        console.print(
-            "[bold red]Error:[/bold red] Cannot specify both --project and --global flags."
-        )
+        console.print(_ERR_BOTH_SCOPES)
         return
 
     show_scope = "both"  # Default
@@ -489,18 +675,15 @@ def _list(
         # Ask user interactively
         scope = _ask_scope("list", allow_both=True)
         if scope is None:
-            console.print("Cancelled.", style=COLORS["dim"])
+            console.print(_CANCELLED)
             return
         show_scope = scope
 
     # Handle project-only view
     if show_scope == "project":
         if not project_skills_dir:
-            console.print("[yellow]Not in a project directory.[/yellow]")
-            console.print(
-                "[dim]Project skills require a .git directory in the project root.[/dim]",
-                style=COLORS["dim"],
-            )
+            console.print(_NOT_IN_PROJECT)
+            console.print(_PROJECT_SKILLS_NEED_GIT)
             return
 
         if not project_skills_dir.exists() or not any(project_skills_dir.iterdir()):
@@ -565,12 +748,7 @@ def _list(
     # Show user skills (for global-only or both views)
     if user_skills and show_scope in ["global", "both"]:
         console.print("[bold cyan]User Skills:[/bold cyan]", style=COLORS["primary"])
-        for skill in user_skills:
-            skill_path = Path(skill["path"])
-            console.print(f"  • [bold]{skill['name']}[/bold]", style=COLORS["primary"])
-            console.print(f"    {skill['description']}", style=COLORS["dim"])
-            console.print(f"    Location: {skill_path.parent}/", style=COLORS["dim"])
-            console.print()
+        console.print(_skills_table(user_skills))
 
     # Show project skills (for project-only or both views)
     if project_skills_list and show_scope in ["project", "both"]:
@@ -579,12 +757,7 @@ def _list(
         console.print(
             "[bold green]Project Skills:[/bold green]", style=COLORS["primary"]
         )
-        for skill in project_skills_list:
-            skill_path = Path(skill["path"])
-            console.print(f"  • [bold]{skill['name']}[/bold]", style=COLORS["primary"])
-            console.print(f"    {skill['description']}", style=COLORS["dim"])
-            console.print(f"    Location: {skill_path.parent}/", style=COLORS["dim"])
-            console.print()
+        console.print(_skills_table(project_skills_list))
 
 
 def _info(
@@ -604,15 +777,12 @@ def _info(
         global_scope: If True, only search in global skills.
         ask: If True and no flags specified, prompt user interactively.
     """
-    settings = Settings.from_environment()
     user_skills_dir = settings.get_user_skills_dir(agent)
     project_skills_dir = settings.get_project_skills_dir()
 
     # Determine what to search - from flags or by asking
     if project and global_scope:
-        console.print(
-            "[bold red]Error:[/bold red] Cannot specify both --project and --global flags."
-        )
+        console.print(_ERR_BOTH_SCOPES)
         return
 
     search_scope = "both"  # Default
@@ -624,14 +794,14 @@ def _info(
         # Ask user interactively
         scope = _ask_scope("search", allow_both=True)
         if scope is None:
-            console.print("Cancelled.", style=COLORS["dim"])
+            console.print(_CANCELLED)
             return
         search_scope = scope
 
     # Load skills based on scope
     if search_scope == "project":
         if not project_skills_dir:
-            console.print("[bold red]Error:[/bold red] Not in a project directory.")
+            console.print(_ERR_NOT_IN_PROJECT)
             return
         skills = list_skills(
             user_skills_dir=None, project_skills_dir=project_skills_dir
@@ -655,7 +825,7 @@ def _info(
 
     # Read the full SKILL.md file
     skill_path = Path(skill["path"])
-    skill_content = skill_path.read_text()
+    skill_content = skill_path.read_bytes().decode("utf-8")
 
     # Determine source label
     source_label = "Project Skill" if skill["source"] == "project" else "User Skill"
@@ -671,13 +841,13 @@ def _info(
     console.print(f"[bold]Location:[/bold] {skill_path.parent}/\n", style=COLORS["dim"])
 
     # List supporting files
-    skill_dir = skill_path.parent
-    supporting_files = [f for f in skill_dir.iterdir() if f.name != "SKILL.md"]
+    with os.scandir(skill_path.parent) as entries:
+        supporting_files = [entry.name for entry in entries if entry.name != "SKILL.md"]
 
     if supporting_files:
         console.print("[bold]Supporting Files:[/bold]", style=COLORS["dim"])
-        for file in supporting_files:
-            console.print(f"  - {file.name}", style=COLORS["dim"])
+        for file_name in supporting_files:
+            console.print(f"  - {file_name}", style=COLORS["dim"])
         console.print()
 
     # Show the full SKILL.md content
@@ -721,6 +891,12 @@ def setup_skills_parser(
         action="store_true",
         help="Show only global skills (user-level)",
     )
+    list_parser.add_argument(
+        "-y",
+        "--yes",
+        action="store_true",
+        help="Don't prompt for a scope; use the default for the current directory",
+    )
 
     # Skills create
     create_parser = skills_subparsers.add_parser(
@@ -729,7 +905,9 @@ def setup_skills_parser(
         description="Create a new skill with a template SKILL.md file",
     )
     create_parser.add_argument(
-        "name", help="Name of the skill to create (e.g., web-research)"
+        "name",
+        nargs="+",
+        help="Name(s) of the skill(s) to create (e.g., web-research)",
     )
     create_parser.add_argument(
         "--agent",
@@ -747,6 +925,17 @@ def setup_skills_parser(
         action="store_true",
         help="Create skill in global directory (user-level)",
     )
+    create_parser.add_argument(
+        "--description",
+        default=None,
+        help="Short description of what the skill should do, used to guide generation",
+    )
+    create_parser.add_argument(
+        "-y",
+        "--yes",
+        action="store_true",
+        help="Don't prompt for a scope; use the default for the current directory",
+    )
 
     # Skills info
     info_parser = skills_subparsers.add_parser(
@@ -771,4 +960,10 @@ def setup_skills_parser(
         action="store_true",
         help="Search only in global skills (user-level)",
     )
+    info_parser.add_argument(
+        "-y",
+        "--yes",
+        action="store_true",
+        help="Don't prompt for a scope; use the default for the current directory",
+    )
     return skills_parser
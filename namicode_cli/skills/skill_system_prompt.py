@@ -1,4 +1,7 @@
-SKILL_CREATION = """
+# The skill creation prompt is split so that everything but the target directory
+# is a byte-identical prefix across calls, letting provider prompt caching reuse it.
+# Compose as SKILL_CREATION_STABLE + SKILL_CREATION_DYNAMIC.format(skill_dir=...).
+SKILL_CREATION_STABLE = """
 Role: Create minimal, reusable Skills for AI agents.
 
 Objective: Produce precise, modular skill packages that are immediately usable by other AI systems.
@@ -24,10 +27,10 @@ Audience: A highly capable AI agent.
 DIRECTORY STRUCTURE
 ================================================================================
 
-All files must live under {skill_dir}.
+All files must live under the skill directory named at the end of these instructions.
 
 Allowed structure:
-{skill_dir}/
+<skill_dir>/
 ├── SKILL.md            (required)
 ├── scripts/            (optional)
 ├── references/         (optional)
@@ -141,7 +144,7 @@ SKILL CREATION PROCESS
 
 1. Define scope and usage triggers
 2. Decide what belongs in SKILL.md vs resources
-3. Inspect or initialize {skill_dir}
+3. Inspect or initialize the skill directory
 4. Implement resources first
 5. Write SKILL.md (frontmatter first, always)
 6. Validate structure and constraints
@@ -174,3 +177,11 @@ Never:
 Design principle:
 Precision over completeness. Every line must earn its tokens.
 """
+
+SKILL_CREATION_DYNAMIC = """
+================================================================================
+SKILL DIRECTORY
+================================================================================
+
+All files must live under {skill_dir}.
+"""
@@ -1,33 +1,54 @@
+import asyncio
+from dataclasses import dataclass, field
+from os import urandom
 from pathlib import Path
-import uuid
 
 
+@dataclass(slots=True, eq=False)
 class SessionState:
-    """Holds mutable session state (auto-approve mode, etc)."""
-
-    def __init__(self, auto_approve: bool = False, no_splash: bool = False) -> None:
-        self.auto_approve = auto_approve
-        self.no_splash = no_splash
-        self.exit_hint_until: float | None = None
-        self.exit_hint_handle = None
-        self.thread_id = str(uuid.uuid4())
-        # Session persistence fields
-        self.session_id: str | None = None
-        self.is_continued: bool = False
-        self.todos: list[dict] | None = None
-        # Plan mode fields
-        self.plan_mode_enabled: bool = False
-        self.pending_plan_exit: bool = False  # Flag for deferred plan exit with approval
-        self.pending_plan_mode_sync: bool = False  # Flag to sync plan mode to agent state
+    """Holds mutable session state (auto-approve mode, etc).
+
+    Only auto_approve and no_splash are constructor arguments; the remaining
+    fields start at their defaults and are updated as the session runs.
+    Compared by identity, like any other live session object.
+    """
+
+    auto_approve: bool = False
+    no_splash: bool = False
+    # (deadline, timer clearing the hint) while the Ctrl+C exit hint is shown
+    exit_hint: tuple[float, asyncio.TimerHandle] | None = field(default=None, init=False)
+    # Generated on first access, see `thread_id`
+    _thread_id: str | None = field(default=None, init=False, repr=False)
+    # Session persistence fields
+    session_id: str | None = field(default=None, init=False)
+    is_continued: bool = field(default=False, init=False)
+    todos: list[dict] | None = field(default=None, init=False)
+    # Plan mode fields
+    plan_mode_enabled: bool = field(default=False, init=False)
+    # Flag for deferred plan exit with approval
+    pending_plan_exit: bool = field(default=False, init=False)
+    # Flag to sync plan mode to agent state
+    pending_plan_mode_sync: bool = field(default=False, init=False)
+
+    @property
+    def thread_id(self) -> str:
+        """Thread id for the agent checkpointer, generated on first access."""
+        thread_id = self._thread_id
+        if thread_id is None:
+            # Opaque id from the OS CSPRNG; it keys checkpoints across processes
+            thread_id = self._thread_id = urandom(16).hex()
+        return thread_id
+
+    @thread_id.setter
+    def thread_id(self, value: str) -> None:
+        self._thread_id = value
 
     def toggle_auto_approve(self) -> bool:
         """Toggle auto-approve and return new state."""
-        self.auto_approve = not self.auto_approve
+        self.auto_approve ^= True
         return self.auto_approve
 
     def toggle_plan_mode(self) -> bool:
         """Toggle plan mode and return new state."""
-        self.plan_mode_enabled = not self.plan_mode_enabled
+        self.plan_mode_enabled ^= True
         return self.plan_mode_enabled
-
-
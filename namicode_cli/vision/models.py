@@ -7,39 +7,41 @@ across different LLM providers (Anthropic, OpenAI, Google, Ollama).
 from typing import Literal
 
 # Registry of known vision-capable models
-VISION_CAPABLE_MODELS: dict[str, bool] = {
-    # Anthropic Claude models
-    "claude-sonnet-4-5-20250929": True,
-    "claude-opus-4-5-20251001": True,
-    "claude-3-5-sonnet-20241022": True,
-    "claude-3-5-sonnet-20240620": True,
-    "claude-3-5-haiku-20241022": True,
-    "claude-3-opus-20240229": True,
-
-    # OpenAI models
-    "gpt-4o": True,
-    "gpt-4o-mini": True,
-    "gpt-4-turbo": True,
-    "gpt-4-vision-preview": True,
-
-    # Google Gemini models
-    "gemini-1.5-pro": True,
-    "gemini-1.5-flash": True,
-    "gemini-2.0-flash-exp": True,
-
-    # Ollama vision models
-    "qwen3-vl": True,
-    "qwen3-vl:235b-cloud": True,
-    "llava": True,
-    "llava:latest": True,
-    "llava:7b": True,
-    "llava:13b": True,
-    "llava:34b": True,
-    "llava-llama-3": True,
-    "bakllava": True,
-    "moondream": True,
-    "moondream:latest": True,
-}
+VISION_CAPABLE_MODELS: frozenset[str] = frozenset(
+    {
+        # Anthropic Claude models
+        "claude-sonnet-4-5-20250929",
+        "claude-opus-4-5-20251001",
+        "claude-3-5-sonnet-20241022",
+        "claude-3-5-sonnet-20240620",
+        "claude-3-5-haiku-20241022",
+        "claude-3-opus-20240229",
+
+        # OpenAI models
+        "gpt-4o",
+        "gpt-4o-mini",
+        "gpt-4-turbo",
+        "gpt-4-vision-preview",
+
+        # Google Gemini models
+        "gemini-1.5-pro",
+        "gemini-1.5-flash",
+        "gemini-2.0-flash-exp",
+
+        # Ollama vision models
+        "qwen3-vl",
+        "qwen3-vl:235b-cloud",
+        "llava",
+        "llava:latest",
+        "llava:7b",
+        "llava:13b",
+        "llava:34b",
+        "llava-llama-3",
+        "bakllava",
+        "moondream",
+        "moondream:latest",
+    }
+)
 
 
 # Keywords that suggest a model might support vision
@@ -73,13 +75,13 @@ def model_supports_vision(model_name: str) -> bool:
     """
     # Direct lookup in registry
     if model_name in VISION_CAPABLE_MODELS:
-        return VISION_CAPABLE_MODELS[model_name]
+        return True
 
     # Check base model name (without tag/version)
     # e.g., "qwen3-vl:235b-cloud" -> "qwen3-vl"
     base_name = model_name.split(":")[0]
     if base_name in VISION_CAPABLE_MODELS:
-        return VISION_CAPABLE_MODELS[base_name]
+        return True
 
     # Heuristic: check for vision-related keywords
     model_lower = model_name.lower()
@@ -109,7 +111,7 @@ def get_vision_models(provider: Literal["anthropic", "openai", "google", "ollama
     prefix = provider_models.get(provider, [])
 
     vision_models = []
-    for model_name in VISION_CAPABLE_MODELS.keys():
+    for model_name in sorted(VISION_CAPABLE_MODELS):
         if any(model_name.startswith(p) for p in prefix):
             vision_models.append(model_name)
 
@@ -1,14 +1,84 @@
 """Unit tests for MCP middleware functionality."""
 
+import asyncio
+import contextlib
+import os
+import time
+from collections.abc import AsyncIterator, Callable, Sequence
 from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from langchain.agents import create_agent
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.runnables import Runnable
+from langchain_core.tools import BaseTool, StructuredTool
 
 from namicode_cli.mcp.config import MCPConfig, MCPServerConfig
 from namicode_cli.mcp.middleware import MCPMiddleware, MCPState
 
 
+class FixedGenericFakeChatModel(GenericFakeChatModel):
+    """Fixed version of GenericFakeChatModel that properly handles bind_tools."""
+
+    def bind_tools(
+        self,
+        tools: Sequence[dict[str, Any] | type | Callable | BaseTool],
+        *,
+        tool_choice: str | None = None,
+        **kwargs: Any,
+    ) -> Runnable[LanguageModelInput, AIMessage]:
+        """Override bind_tools to return self."""
+        return self
+
+
+def _mcp_tool(name: str) -> StructuredTool:
+    """Build a tool shaped like the ones langchain-mcp-adapters loads."""
+
+    async def call_tool(**arguments: Any) -> tuple[str, None]:
+        return f"{name} called with {arguments}", None
+
+    return StructuredTool(
+        name=name,
+        description=f"The {name} tool",
+        args_schema={"type": "object", "properties": {"query": {"type": "string"}}},
+        coroutine=call_tool,
+        response_format="content_and_artifact",
+    )
+
+
+@contextlib.asynccontextmanager
+async def _fake_session(server_name: str) -> AsyncIterator[MagicMock]:
+    """Stand-in for MultiServerMCPClient.session()."""
+    yield MagicMock()
+
+
+@pytest.fixture
+def docs_config(tmp_path: Path) -> Path:
+    """Config path with a single 'docs' server."""
+    config_path = tmp_path / "mcp.json"
+    MCPConfig(config_path).add_server(
+        "docs",
+        MCPServerConfig(transport="http", url="https://example.com/mcp"),
+    )
+    return config_path
+
+
+@pytest.fixture
+def mcp_server() -> Any:
+    """Patch the MCP connection; yields the load_mcp_tools mock."""
+    with (
+        patch.object(MCPMiddleware, "_ensure_session", AsyncMock(return_value=MagicMock())),
+        patch(
+            "langchain_mcp_adapters.tools.load_mcp_tools", AsyncMock(return_value=[])
+        ) as load_mcp_tools,
+    ):
+        yield load_mcp_tools
+
+
 class TestMCPMiddlewareInit:
     """Test MCPMiddleware initialization."""
 
@@ -108,7 +178,6 @@ class TestMCPMiddlewareWrapModelCall:
         middleware = MCPMiddleware(config_path=tmp_path / "mcp.json")
 
         mock_request = MagicMock()
-        mock_request.state = {}  # No mcp_tools
         mock_request.system_prompt = "Original prompt"
 
         mock_handler = MagicMock(return_value="response")
@@ -119,23 +188,22 @@ class TestMCPMiddlewareWrapModelCall:
         mock_handler.assert_called_once_with(mock_request)
         assert result == "response"
 
-    def test_wrap_model_call_with_mcp_tools(self, tmp_path: Path):
+    def test_wrap_model_call_with_mcp_tools(self, tmp_path: Path, mcp_server: Any):
         """Test wrap_model_call injects MCP section into prompt."""
         config_path = tmp_path / "mcp.json"
-        middleware = MCPMiddleware(config_path=config_path)
 
         # Add a server to config
-        middleware.mcp_config.add_server(
+        MCPConfig(config_path).add_server(
             "test",
             MCPServerConfig(transport="http", url="https://example.com"),
         )
+        middleware = MCPMiddleware(config_path=config_path)
+        middleware._tools_cache = [
+            {"name": "search", "description": "Search docs", "server": "test"}
+        ]
+        middleware._refresh_mcp_section()
 
         mock_request = MagicMock()
-        mock_request.state = {
-            "mcp_tools": [
-                {"name": "search", "description": "Search docs", "server": "test"}
-            ]
-        }
         mock_request.system_prompt = "Original prompt"
 
         modified_request = MagicMock()
@@ -162,7 +230,6 @@ class TestMCPMiddlewareWrapModelCall:
         middleware = MCPMiddleware(config_path=tmp_path / "mcp.json")
 
         mock_request = MagicMock()
-        mock_request.state = {}
 
         mock_handler = AsyncMock(return_value="response")
 
@@ -172,22 +239,21 @@ class TestMCPMiddlewareWrapModelCall:
         assert result == "response"
 
     @pytest.mark.asyncio
-    async def test_awrap_model_call_with_mcp_tools(self, tmp_path: Path):
+    async def test_awrap_model_call_with_mcp_tools(self, tmp_path: Path, mcp_server: Any):
         """Test awrap_model_call injects MCP section into prompt."""
         config_path = tmp_path / "mcp.json"
-        middleware = MCPMiddleware(config_path=config_path)
 
-        middleware.mcp_config.add_server(
+        MCPConfig(config_path).add_server(
             "test",
             MCPServerConfig(transport="http", url="https://example.com"),
         )
+        middleware = MCPMiddleware(config_path=config_path)
+        middleware._tools_cache = [
+            {"name": "fetch", "description": "Fetch page", "server": "test"}
+        ]
+        middleware._refresh_mcp_section()
 
         mock_request = MagicMock()
-        mock_request.state = {
-            "mcp_tools": [
-                {"name": "fetch", "description": "Fetch page", "server": "test"}
-            ]
-        }
         mock_request.system_prompt = "Base prompt"
 
         modified_request = MagicMock()
@@ -343,3 +409,226 @@ class TestMCPMiddlewareToolCaller:
 
         assert result1 == {"from": "server1"}
         assert result2 == {"from": "server2"}
+
+
+class TestMCPMiddlewareAgent:
+    """Test MCP tools registered with a real create_agent graph."""
+
+    def test_tool_call_after_construction(self, docs_config: Path, mcp_server: Any):
+        """Test that a server connected after agent creation serves its tools."""
+        mcp_server.return_value = [_mcp_tool("search")]
+        MCPMiddleware(config_path=docs_config)  # cold start writes the tools cache
+
+        middleware = MCPMiddleware(config_path=docs_config)
+        assert [tool.name for tool in middleware.tools] == ["search"]
+
+        # The server now exposes an extra tool; only registered tools are advertised
+        mcp_server.reset_mock()
+        mcp_server.return_value = [_mcp_tool("search"), _mcp_tool("fetch")]
+        model = FixedGenericFakeChatModel(
+            messages=iter(
+                [
+                    AIMessage(
+                        content="",
+                        tool_calls=[{"name": "search", "args": {"query": "mcp"}, "id": "call_1"}],
+                    ),
+                    AIMessage(content="Done"),
+                ]
+            )
+        )
+        agent = create_agent(model=model, middleware=[middleware])
+
+        result = agent.invoke({"messages": [HumanMessage(content="Search the docs")]})
+
+        tool_messages = [msg for msg in result["messages"] if isinstance(msg, ToolMessage)]
+        assert len(tool_messages) == 1
+        assert tool_messages[0].content == "search called with {'query': 'mcp'}"
+        assert result["messages"][-1].content == "Done"
+        mcp_server.assert_awaited_once()
+        assert [tool.name for tool in middleware.tools] == ["search"]
+        assert "fetch" not in (middleware._cached_mcp_section or "")
+
+        # The next start registers the tool the server added
+        assert [tool.name for tool in MCPMiddleware(config_path=docs_config).tools] == [
+            "search",
+            "fetch",
+        ]
+
+    def test_prompt_injected_into_model_call(self, docs_config: Path, mcp_server: Any):
+        """Test that the model sees the MCP section and the MCP tool in a real agent."""
+        mcp_server.return_value = [_mcp_tool("search")]
+        middleware = MCPMiddleware(config_path=docs_config)
+        model = FixedGenericFakeChatModel(messages=iter([AIMessage(content="Hi")]))
+        agent = create_agent(model=model, system_prompt="Base prompt", middleware=[middleware])
+
+        with (
+            patch.object(
+                FixedGenericFakeChatModel,
+                "bind_tools",
+                autospec=True,
+                side_effect=lambda self, tools, **kwargs: self,
+            ) as bind_tools,
+            patch.object(
+                FixedGenericFakeChatModel,
+                "_generate",
+                autospec=True,
+                side_effect=GenericFakeChatModel._generate,
+            ) as generate,
+        ):
+            agent.invoke({"messages": [HumanMessage(content="Hello")]})
+
+        bound_tools = bind_tools.call_args.args[1]
+        assert [tool.name for tool in bound_tools] == ["search"]
+        system_message = generate.call_args.args[1][0]
+        assert system_message.content.startswith("Base prompt")
+        assert "**docs** (http)" in system_message.content
+        assert "search: The search tool" in system_message.content
+
+
+class TestMCPMiddlewareToolsCache:
+    """Test the on-disk tool metadata cache."""
+
+    def test_cache_hit_skips_discovery(self, docs_config: Path, mcp_server: Any):
+        """Test that a fresh cache registers tools without connecting."""
+        mcp_server.return_value = [_mcp_tool("search")]
+        MCPMiddleware(config_path=docs_config)
+        mcp_server.reset_mock()
+
+        middleware = MCPMiddleware(config_path=docs_config)
+
+        mcp_server.assert_not_awaited()
+        assert [tool.name for tool in middleware.tools] == ["search"]
+        assert "search: The search tool" in (middleware._cached_mcp_section or "")
+
+    def test_stale_cache_is_rediscovered(self, docs_config: Path, mcp_server: Any):
+        """Test that a cache older than a day is rebuilt before tools are registered."""
+        mcp_server.return_value = [_mcp_tool("search")]
+        cache_path = MCPMiddleware(config_path=docs_config)._tools_cache_path
+        two_days_ago = time.time() - 2 * 24 * 60 * 60
+        os.utime(cache_path, (two_days_ago, two_days_ago))
+        mcp_server.reset_mock()
+        mcp_server.return_value = [_mcp_tool("search"), _mcp_tool("fetch")]
+
+        middleware = MCPMiddleware(config_path=docs_config)
+
+        mcp_server.assert_awaited_once()
+        assert [tool.name for tool in middleware.tools] == ["search", "fetch"]
+        assert cache_path.stat().st_mtime > two_days_ago
+
+    def test_stale_cache_served_when_server_unreachable(self, docs_config: Path, mcp_server: Any):
+        """Test that stale tools stay registered if the server can't be reached."""
+        mcp_server.return_value = [_mcp_tool("search")]
+        cache_path = MCPMiddleware(config_path=docs_config)._tools_cache_path
+        two_days_ago = time.time() - 2 * 24 * 60 * 60
+        os.utime(cache_path, (two_days_ago, two_days_ago))
+
+        with patch.object(
+            MCPMiddleware, "_ensure_session", AsyncMock(side_effect=ConnectionError("down"))
+        ):
+            middleware = MCPMiddleware(config_path=docs_config)
+
+        assert [tool.name for tool in middleware.tools] == ["search"]
+        # The stale file is kept so the next start retries
+        assert cache_path.stat().st_mtime == pytest.approx(two_days_ago)
+
+
+class TestMCPMiddlewareSessions:
+    """Test the lifecycle of persistent server sessions."""
+
+    def test_close_exits_session_in_owning_task(self, tmp_path: Path):
+        """Test that close() exits each session in the task that entered it."""
+        middleware = MCPMiddleware(config_path=tmp_path / "mcp.json")
+        tasks: list[asyncio.Task | None] = []
+
+        @contextlib.asynccontextmanager
+        async def session(server_name: str) -> AsyncIterator[MagicMock]:
+            tasks.append(asyncio.current_task())
+            yield MagicMock()
+            tasks.append(asyncio.current_task())
+
+        middleware._client = MagicMock(session=session)
+        docs_session = middleware._run_sync(middleware._ensure_session("docs"))
+        assert middleware._sessions == {"docs": docs_session}
+
+        middleware.close()
+
+        assert len(tasks) == 2
+        assert tasks[0] is tasks[1]
+        assert middleware._sessions == {}
+
+    def test_dead_session_is_evicted(self, tmp_path: Path):
+        """Test that a session torn down by its transport is dropped."""
+        middleware = MCPMiddleware(config_path=tmp_path / "mcp.json")
+        middleware._client = MagicMock(session=_fake_session)
+        middleware._run_sync(middleware._ensure_session("docs"))
+        task, _ = middleware._session_tasks["docs"]
+
+        # anyio cancels the owning task when the server goes away
+        middleware._get_bg_loop().call_soon_threadsafe(task.cancel)
+        middleware._run_sync(asyncio.wait([task]))
+
+        assert middleware._sessions == {}
+        assert middleware._session_tasks == {}
+
+    def test_failed_call_evicts_session(self, docs_config: Path):
+        """Test that a failed tool call drops the session and the next call reconnects."""
+        connects: list[str] = []
+
+        @contextlib.asynccontextmanager
+        async def session(server_name: str) -> AsyncIterator[MagicMock]:
+            connects.append(server_name)
+            yield MagicMock()
+
+        calls: list[dict[str, Any]] = []
+
+        async def call_tool(**arguments: Any) -> tuple[str, None]:
+            calls.append(arguments)
+            if len(calls) == 1:
+                raise BrokenPipeError("server went away")
+            return "ok", None
+
+        tool = StructuredTool(
+            name="search",
+            description="Search",
+            args_schema={"type": "object", "properties": {"query": {"type": "string"}}},
+            coroutine=call_tool,
+            response_format="content_and_artifact",
+        )
+        with (
+            patch(
+                "namicode_cli.mcp.middleware.create_mcp_client",
+                return_value=MagicMock(session=session),
+            ),
+            patch("langchain_mcp_adapters.tools.load_mcp_tools", AsyncMock(return_value=[tool])),
+        ):
+            middleware = MCPMiddleware(config_path=docs_config)
+            proxy = middleware.tools[0]
+
+            with pytest.raises(BrokenPipeError):
+                proxy.invoke({"query": "first"})
+            assert middleware._sessions == {}
+
+            assert proxy.invoke({"query": "second"}) == "ok"
+
+        assert connects == ["docs", "docs"]
+        middleware.close()
+
+    def test_connect_retries_exception_groups(self, tmp_path: Path):
+        """Test that anyio's ExceptionGroup connect failures are retried."""
+        attempts: list[str] = []
+
+        @contextlib.asynccontextmanager
+        async def session(server_name: str) -> AsyncIterator[MagicMock]:
+            attempts.append(server_name)
+            if len(attempts) == 1:
+                raise ExceptionGroup("connect failed", [ConnectionRefusedError()])
+            yield MagicMock()
+
+        middleware = MCPMiddleware(config_path=tmp_path / "mcp.json")
+        middleware._client = MagicMock(session=session)
+        with patch("namicode_cli.mcp.middleware._MAX_RECONNECT_DELAY", 0):
+            middleware._run_sync(middleware._ensure_session("docs"))
+
+        assert attempts == ["docs", "docs"]
+        middleware.close()
+
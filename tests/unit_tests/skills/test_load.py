@@ -1,10 +1,24 @@
 """Unit tests for skills loading functionality."""
 
+import os
 from pathlib import Path
 
+import pytest
+
+from namicode_cli.skills import load
 from namicode_cli.skills.load import list_skills
 
 
+@pytest.fixture(autouse=True)
+def isolated_skills_index(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the skills index at tmp_path and start each test with a cold cache."""
+    index_path = tmp_path / "skills_index.json"
+    monkeypatch.setattr(load, "_skills_index_path", lambda: index_path)
+    monkeypatch.setattr(load, "_skill_cache", {})
+    monkeypatch.setattr(load, "_skills_index_loaded", False)
+    return index_path
+
+
 class TestListSkillsSingleDirectory:
     """Test list_skills function for loading skills from a single directory."""
 
@@ -110,6 +124,39 @@ Content
         skills = list_skills(user_skills_dir=skills_dir, project_skills_dir=None)
         assert skills == []
 
+    @pytest.mark.skipif(not hasattr(os, "O_NOFOLLOW"), reason="requires O_NOFOLLOW")
+    def test_list_skills_ignores_symlinked_skill_md(self, tmp_path: Path) -> None:
+        """Test that a SKILL.md symlinked to a file outside the skills dir is not loaded."""
+        outside = tmp_path / "outside.md"
+        outside.write_text("""---
+name: linked-skill
+description: Outside the skills directory
+---
+""")
+        skills_dir = tmp_path / "skills"
+        skill_dir = skills_dir / "linked-skill"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").symlink_to(outside)
+
+        skills = list_skills(user_skills_dir=skills_dir, project_skills_dir=None)
+        assert skills == []
+
+    def test_list_skills_ignores_symlinked_skill_dir(self, tmp_path: Path) -> None:
+        """Test that a skill directory symlinked from outside the skills dir is not loaded."""
+        outside_dir = tmp_path / "outside-skill"
+        outside_dir.mkdir()
+        (outside_dir / "SKILL.md").write_text("""---
+name: outside-skill
+description: Outside the skills directory
+---
+""")
+        skills_dir = tmp_path / "skills"
+        skills_dir.mkdir()
+        (skills_dir / "outside-skill").symlink_to(outside_dir, target_is_directory=True)
+
+        skills = list_skills(user_skills_dir=skills_dir, project_skills_dir=None)
+        assert skills == []
+
 
 class TestListSkillsMultipleDirectories:
     """Test list_skills function for loading from multiple directories."""
@@ -290,3 +337,141 @@ Content
         skills = list_skills(user_skills_dir=user_dir, project_skills_dir=None)
         assert len(skills) == 1
         assert skills[0]["name"] == "valid-skill"
+
+
+class TestListSkillsCache:
+    """Test that repeated list_skills calls pick up on-disk changes."""
+
+    def test_list_skills_sees_edited_skill(self, tmp_path: Path) -> None:
+        """Test that editing a SKILL.md invalidates the cached result."""
+        skills_dir = tmp_path / "skills"
+        skill_dir = skills_dir / "cached-skill"
+        skill_dir.mkdir(parents=True)
+        skill_md = skill_dir / "SKILL.md"
+        skill_md.write_text("""---
+name: cached-skill
+description: Before edit
+---
+""")
+
+        skills = list_skills(user_skills_dir=skills_dir, project_skills_dir=None)
+        assert skills[0]["description"] == "Before edit"
+
+        skill_md.write_text("""---
+name: cached-skill
+description: After edit
+---
+""")
+        # Make sure the mtime moves even on filesystems with coarse timestamps
+        mtime_ns = skill_md.stat().st_mtime_ns + 1_000_000_000
+        os.utime(skill_md, ns=(mtime_ns, mtime_ns))
+
+        skills = list_skills(user_skills_dir=skills_dir, project_skills_dir=None)
+        assert skills[0]["description"] == "After edit"
+
+    def test_list_skills_sees_edit_within_same_mtime(self, tmp_path: Path) -> None:
+        """Test that an edit keeping the same mtime is caught by the size change."""
+        skills_dir = tmp_path / "skills"
+        skill_dir = skills_dir / "cached-skill"
+        skill_dir.mkdir(parents=True)
+        skill_md = skill_dir / "SKILL.md"
+        skill_md.write_text("""---
+name: cached-skill
+description: Short
+---
+""")
+        mtime_ns = skill_md.stat().st_mtime_ns
+
+        skills = list_skills(user_skills_dir=skills_dir, project_skills_dir=None)
+        assert skills[0]["description"] == "Short"
+
+        skill_md.write_text("""---
+name: cached-skill
+description: Much longer description
+---
+""")
+        # Simulate a coarse timestamp: the edit lands in the same tick
+        os.utime(skill_md, ns=(mtime_ns, mtime_ns))
+
+        skills = list_skills(user_skills_dir=skills_dir, project_skills_dir=None)
+        assert skills[0]["description"] == "Much longer description"
+
+    def test_list_skills_returns_copies(self, tmp_path: Path) -> None:
+        """Test that modifying a returned skill doesn't change later results."""
+        skills_dir = tmp_path / "skills"
+        skill_dir = skills_dir / "copied-skill"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("""---
+name: copied-skill
+description: Original
+---
+""")
+
+        skills = list_skills(user_skills_dir=skills_dir, project_skills_dir=None)
+        skills[0]["description"] = "Changed by caller"
+        skills.clear()
+
+        skills = list_skills(user_skills_dir=skills_dir, project_skills_dir=None)
+        assert skills[0]["description"] == "Original"
+
+    def test_list_skills_sees_added_skill(self, tmp_path: Path) -> None:
+        """Test that adding a skill directory invalidates the cached result."""
+        skills_dir = tmp_path / "skills"
+        skills_dir.mkdir()
+        assert list_skills(user_skills_dir=skills_dir, project_skills_dir=None) == []
+
+        skill_dir = skills_dir / "new-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text("""---
+name: new-skill
+description: Added later
+---
+""")
+
+        skills = list_skills(user_skills_dir=skills_dir, project_skills_dir=None)
+        assert [s["name"] for s in skills] == ["new-skill"]
+
+    def test_list_skills_cache_hit_skips_thread_pool(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that unchanged directories are served without starting threads."""
+        user_dir = tmp_path / "user_skills"
+        project_dir = tmp_path / "project_skills"
+        for skills_dir, name in ((user_dir, "user-skill"), (project_dir, "project-skill")):
+            skill_dir = skills_dir / name
+            skill_dir.mkdir(parents=True)
+            (skill_dir / "SKILL.md").write_text(f"""---
+name: {name}
+description: A skill
+---
+""")
+        first = list_skills(user_skills_dir=user_dir, project_skills_dir=project_dir)
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("thread pool used on a cache hit")
+
+        monkeypatch.setattr(load, "ThreadPoolExecutor", fail)
+        second = list_skills(user_skills_dir=user_dir, project_skills_dir=project_dir)
+        assert second == first
+
+
+class TestListSkillsFrontmatter:
+    """Test frontmatter forms beyond flat ``key: value`` lines."""
+
+    def test_list_skills_quoted_and_nested_frontmatter(self, tmp_path: Path) -> None:
+        """Test that quoted values and nested metadata parse as YAML would."""
+        skills_dir = tmp_path / "skills"
+        skill_dir = skills_dir / "yaml-skill"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("""---
+name: yaml-skill
+description: "Parses: quoted values"
+metadata:
+  owner: docs
+---
+""")
+
+        skills = list_skills(user_skills_dir=skills_dir, project_skills_dir=None)
+        assert len(skills) == 1
+        assert skills[0]["description"] == "Parses: quoted values"
+        assert skills[0]["metadata"] == {"owner": "docs"}
@@ -0,0 +1,58 @@
+"""Unit tests for the generated-skill cache."""
+
+from pathlib import Path
+
+import pytest
+
+from namicode_cli.skills import skill_cache
+from namicode_cli.skills.skill_cache import (
+    adapt_cached_skill,
+    get_cached_skill,
+    read_skill_files,
+    set_cached_skill,
+    skill_cache_key,
+    write_skill_files,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_skill_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the cache database inside tmp_path."""
+    monkeypatch.setattr(skill_cache, "SKILL_CACHE_PATH", tmp_path / "skill_cache.db")
+
+
+class TestSkillCache:
+    """Test storing and restoring whole generated skills."""
+
+    def test_round_trip_includes_supporting_files(self, tmp_path: Path) -> None:
+        """Test that a cache hit recreates SKILL.md and its supporting files."""
+        generated = tmp_path / "generated" / "web-research"
+        (generated / "scripts").mkdir(parents=True)
+        (generated / "SKILL.md").write_text("---\nname: web-research\n---\n\nBody\n")
+        (generated / "scripts" / "search.py").write_text("print('search')\n")
+
+        key = skill_cache_key("web-research", None)
+        set_cached_skill(key, read_skill_files(generated))
+
+        cached = get_cached_skill(key)
+        assert cached is not None
+        target = tmp_path / "created" / "web-research"
+        write_skill_files(target, cached)
+
+        assert (target / "SKILL.md").read_text() == "---\nname: web-research\n---\n\nBody\n"
+        assert (target / "scripts" / "search.py").read_text() == "print('search')\n"
+
+    def test_miss_returns_none(self) -> None:
+        """Test that an unknown key is a miss."""
+        assert get_cached_skill(skill_cache_key("unknown", None)) is None
+
+    def test_write_rejects_paths_outside_skill_dir(self, tmp_path: Path) -> None:
+        """Test that cached paths can't escape the skill directory."""
+        with pytest.raises(ValueError):
+            write_skill_files(tmp_path / "skill", {"../escape.txt": "x"})
+
+    def test_adapt_rewrites_name_and_description(self) -> None:
+        """Test that a cached SKILL.md is pointed at the requested skill."""
+        content = "---\nname: old-name\ndescription: Old\n---\n\nBody\n"
+        adapted = adapt_cached_skill(content, "new-name", "New description")
+        assert adapted == "---\nname: new-name\ndescription: New description\n---\n\nBody\n"